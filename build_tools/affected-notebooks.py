@@ -0,0 +1,267 @@
+"""
+Find the JupyterBook pages affected by a set of changed files.
+
+Each python script of the JupyterBook depends on its own source, on
+python_scripts/matplotlibrc, on the python packages of python_scripts it
+imports and on the data files it reads. Data dependencies are found by static
+analysis of the string literals of the script that point to ../datasets or
+../figures, e.g. pd.read_csv("../datasets/penguins.csv"), and of the names
+passed to the dataset registry, e.g. load_dataset("penguins"). Format strings
+like "../datasets/financial-data/{}.csv" are turned into glob patterns. Calls
+to the loaders of the dataset_tools package that read vendored files without
+being passed their names, e.g. load_price_panel(), depend on these files.
+
+jupyter-cache only looks at the code of the notebooks so it does not notice
+when another dependency changes. The invalidate-cache command removes the
+cached outputs of the notebooks whose other dependencies changed since the
+last build, so that only those notebooks and the ones whose code changed are
+executed by jupyter-book.
+
+Usage:
+    git diff --name-only origin/main... | python build_tools/affected-notebooks.py affected
+    python build_tools/affected-notebooks.py invalidate-cache jupyter-book/_build/.jupyter_cache
+"""
+
+import argparse
+import ast
+import fnmatch
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+import yaml
+
+from jupyter_cache import get_cache
+
+
+# This hard-code the git repo root directory relative to this script
+root_dir = Path(__file__).parents[1]
+jupyter_book_dir = root_dir / "jupyter-book"
+
+# Files that affect the outputs of all the notebooks
+COMMON_DEPENDENCIES = ["python_scripts/matplotlibrc"]
+# Folders of the data files, relative to the repo root
+DATA_DIRS = ["datasets", "figures"]
+# Loaders of the dataset_tools package and the vendored files they read
+VENDORED_DATASETS = {
+    "load_price_panel": "datasets/financial-data/*.csv",
+}
+HASHES_FILENAME = "dependencies.json"
+
+
+def get_toc_docnames(toc_path=jupyter_book_dir / "_toc.yml"):
+    """Returns all the docnames listed in _toc.yml."""
+
+    def iter_docnames(node):
+        if isinstance(node, dict):
+            if "file" in node:
+                yield node["file"]
+            for value in node.values():
+                yield from iter_docnames(value)
+        elif isinstance(node, list):
+            for value in node:
+                yield from iter_docnames(value)
+
+    toc = yaml.safe_load(toc_path.read_text())
+    return [toc["root"]] + list(iter_docnames(toc))
+
+
+def string_to_pattern(node):
+    """Returns the glob pattern of a string or f-string AST node."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        # "{}" and "{name}" placeholders used with str.format
+        return re.sub(r"\{[^{}]*\}", "*", node.value)
+    if isinstance(node, ast.JoinedStr):
+        return "".join(
+            (value.value if isinstance(value, ast.Constant) else "*")
+            for value in node.values
+        )
+    return None
+
+
+def get_data_dependencies(script_path):
+    """Returns the data files read by a script as glob patterns relative to
+    the repo root.
+    """
+    tree = ast.parse(Path(script_path).read_text())
+    # Parts of f-strings are handled with the f-string itself
+    f_string_parts = {
+        id(value)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.JoinedStr)
+        for value in node.values
+    }
+    patterns = set()
+    for node in ast.walk(tree):
+        func_name = None
+        if isinstance(node, ast.Call):
+            func_name = getattr(
+                node.func, "id", getattr(node.func, "attr", None)
+            )
+        if func_name in VENDORED_DATASETS:
+            patterns.add(VENDORED_DATASETS[func_name])
+        if func_name == "load_dataset" and node.args:
+            # Names of the dataset registry are paths relative to the
+            # datasets folder without the extension
+            pattern = string_to_pattern(node.args[0])
+            if pattern is not None:
+                patterns.add(f"datasets/{pattern}.csv")
+            continue
+        if id(node) in f_string_parts:
+            continue
+        pattern = string_to_pattern(node)
+        if pattern is None:
+            continue
+        for data_dir in DATA_DIRS:
+            if pattern.startswith(f"../{data_dir}/"):
+                patterns.add(pattern[len("../") :])
+    return sorted(patterns)
+
+
+def get_package_dependencies(script_path):
+    """Returns the files of the python packages of python_scripts imported
+    by a script as glob patterns relative to the repo root.
+    """
+    tree = ast.parse(Path(script_path).read_text())
+    patterns = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module is not None:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            package = module.split(".")[0]
+            if (
+                root_dir / "python_scripts" / package / "__init__.py"
+            ).exists():
+                patterns.add(f"python_scripts/{package}/*.py")
+    return sorted(patterns)
+
+
+def get_dependency_graph():
+    """Returns a mapping from docname to dependencies for the notebooks of
+    the JupyterBook.
+
+    Dependencies are glob patterns relative to the repo root.
+    """
+    graph = {}
+    for docname in get_toc_docnames():
+        script_path = jupyter_book_dir / f"{docname}.py"
+        if not script_path.exists():
+            continue
+        graph[docname] = (
+            [str(script_path.relative_to(jupyter_book_dir))]
+            + COMMON_DEPENDENCIES
+            + get_package_dependencies(script_path)
+            + get_data_dependencies(script_path)
+        )
+    return graph
+
+
+def get_affected_docnames(changed_files):
+    """Returns the docnames affected by changed files relative to the repo
+    root.
+    """
+    graph = get_dependency_graph()
+    affected = set()
+    for docname, dependencies in graph.items():
+        if any(
+            fnmatch.fnmatch(changed, pattern)
+            for changed in changed_files
+            for pattern in dependencies
+        ):
+            affected.add(docname)
+
+    for docname in get_toc_docnames():
+        if f"jupyter-book/{docname}.md" in changed_files:
+            affected.add(docname)
+
+    return sorted(affected)
+
+
+def hash_dependencies(dependencies):
+    """Returns a hash of the content of the files matching the dependency
+    patterns.
+    """
+    sha = hashlib.sha256()
+    for pattern in dependencies:
+        for path in sorted(root_dir.glob(pattern)):
+            if not path.is_file():
+                continue
+            sha.update(str(path.relative_to(root_dir)).encode())
+            sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+def invalidate_cache(cache_dir):
+    """Removes the cached outputs of the notebooks whose dependencies, other
+    than their own code, changed since the last call.
+
+    The hashes of the dependencies are stored next to the jupyter-cache
+    database so that they are saved and restored with it.
+    """
+    cache_dir = Path(cache_dir)
+    hashes_path = cache_dir / HASHES_FILENAME
+    previous_hashes = {}
+    if hashes_path.exists():
+        previous_hashes = json.loads(hashes_path.read_text())
+
+    current_hashes = {
+        # The first dependency is the notebook itself, already handled by
+        # jupyter-cache
+        docname: hash_dependencies(dependencies[1:])
+        for docname, dependencies in get_dependency_graph().items()
+    }
+    stale = {
+        docname
+        for docname, data_hash in current_hashes.items()
+        if previous_hashes.get(docname, data_hash) != data_hash
+    }
+
+    if stale and cache_dir.exists():
+        cache = get_cache(cache_dir)
+        for record in cache.list_cache_records():
+            uri = Path(record.uri)
+            docname = f"{uri.parent.name}/{uri.stem}"
+            if docname in stale:
+                print(f"Dependencies of {docname} changed")
+                cache.remove_cache(record.pk)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    hashes_path.write_text(json.dumps(current_hashes, indent=1))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Find the JupyterBook pages affected by changed files."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser(
+        "affected",
+        help=(
+            "print the HTML pages affected by the changed files read on"
+            " stdin, one per line"
+        ),
+    )
+    subparsers.add_parser(
+        "graph", help="print the dependencies of each notebook"
+    )
+    invalidate_parser = subparsers.add_parser(
+        "invalidate-cache",
+        help="remove cached notebooks whose dependencies changed",
+    )
+    invalidate_parser.add_argument("cache_dir")
+    args = parser.parse_args()
+
+    if args.command == "affected":
+        changed_files = sys.stdin.read().split()
+        for docname in get_affected_docnames(changed_files):
+            print(f"{docname}.html")
+    elif args.command == "graph":
+        print(json.dumps(get_dependency_graph(), indent=1))
+    else:
+        invalidate_cache(args.cache_dir)
@@ -0,0 +1,104 @@
+"""
+Micro-benchmark of the cell processing and writing steps of
+convert-python-script-to-notebook.py over all the python scripts of a folder.
+
+It compares:
+- one pass over the cells per processor against a single pass applying all
+  the processors to each cell
+- serialising, parsing and serialising again the notebook to drop the cell ids
+  against dropping the cell ids before serialising
+
+Admonitions are rendered once before timing so that both variants use the
+admonition cache.
+"""
+
+import importlib
+import json
+import sys
+import tempfile
+import time
+from copy import deepcopy
+from pathlib import Path
+
+import jupytext
+
+converter = importlib.import_module("convert-python-script-to-notebook")
+
+
+def process_cells_one_pass_per_processor(nb):
+    for processor in converter.MARKDOWN_PROCESSORS:
+        converter.process_cells(nb, [processor])
+
+
+def process_cells_single_pass(nb):
+    converter.process_cells(nb, converter.MARKDOWN_PROCESSORS)
+
+
+def write_with_round_trip(nb, output_filename):
+    nb_content = jupytext.writes(nb, fmt=".ipynb")
+    nb = json.loads(nb_content)
+
+    for c in nb["cells"]:
+        del c["id"]
+
+    with open(output_filename, "w") as f:
+        json.dump(nb, f, indent=1)
+
+
+def time_func(func, notebooks, n_repeats):
+    """Returns the best time over n_repeats of calling func on all notebooks.
+
+    func is called on copies of the notebooks which are made outside of the
+    timed section.
+    """
+    timings = []
+    for _ in range(n_repeats):
+        nb_copies = [deepcopy(nb) for nb in notebooks]
+        tic = time.perf_counter()
+        for nb in nb_copies:
+            func(nb)
+        timings.append(time.perf_counter() - tic)
+    return min(timings)
+
+
+def main(python_scripts_folder, n_repeats=5):
+    paths = sorted(Path(python_scripts_folder).glob("*.py"))
+    notebooks = [jupytext.read(path) for path in paths]
+    # Warm up the admonition cache
+    for nb in deepcopy(notebooks):
+        process_cells_single_pass(nb)
+
+    processed = deepcopy(notebooks)
+    for nb in processed:
+        process_cells_single_pass(nb)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_filename = Path(tmp_dir) / "notebook.ipynb"
+        results = {
+            "cells, one pass per processor": time_func(
+                process_cells_one_pass_per_processor, notebooks, n_repeats
+            ),
+            "cells, single pass": time_func(
+                process_cells_single_pass, notebooks, n_repeats
+            ),
+            "write, serialise-parse-serialise": time_func(
+                lambda nb: write_with_round_trip(nb, output_filename),
+                processed,
+                n_repeats,
+            ),
+            "write, drop ids then serialise": time_func(
+                lambda nb: converter.write_without_cell_ids(
+                    nb, output_filename
+                ),
+                processed,
+                n_repeats,
+            ),
+        }
+
+    print(f"{len(paths)} python scripts, best of {n_repeats} runs")
+    for name, duration in results.items():
+        print(f"{name:<35} {duration * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
@@ -0,0 +1,113 @@
+"""
+Benchmark of the permutation importance implementations of
+dev_features_importance.py.
+
+The lesson explains permutation importance with a loop over the features and
+the repetitions, `permutation_importance_loop`, and then uses the batched
+`permutation_importance`. Only the batched version is executed by the
+notebook. This script times both on a synthetic regression problem fitted
+with a random forest, with the functions defined in the lesson, and checks
+that they give close importances.
+
+Usage:
+    python build_tools/benchmark-permutation-importance.py
+    python build_tools/benchmark-permutation-importance.py --n-samples 20000
+"""
+
+import argparse
+import ast
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.datasets import make_regression
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.metrics import r2_score
+
+# This hard-code the git repo root directory relative to this script
+root_dir = Path(__file__).parents[1]
+LESSON_PATH = root_dir / "python_scripts" / "dev_features_importance.py"
+FUNCTION_NAMES = [
+    "get_score_after_permutation",
+    "get_feature_importance",
+    "permutation_importance_loop",
+    "_permuted_scores",
+    "permutation_importance",
+]
+
+
+def load_lesson_functions(path=LESSON_PATH):
+    """Returns the permutation importance functions defined in the lesson,
+    without running its other cells.
+    """
+    tree = ast.parse(Path(path).read_text())
+    definitions = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name in FUNCTION_NAMES
+    ]
+    namespace = {
+        "np": np,
+        "pd": pd,
+        "Parallel": Parallel,
+        "delayed": delayed,
+        "effective_n_jobs": effective_n_jobs,
+        "r2_score": r2_score,
+    }
+    module = ast.Module(body=definitions, type_ignores=[])
+    exec(compile(module, str(path), "exec"), namespace)
+    return {name: namespace[name] for name in FUNCTION_NAMES}
+
+
+def main(n_samples, n_features, n_estimators, n_repeats, n_jobs):
+    functions = load_lesson_functions()
+    X, y = make_regression(
+        n_samples=n_samples,
+        n_features=n_features,
+        n_informative=n_features // 2,
+        noise=10,
+        random_state=0,
+    )
+    X = pd.DataFrame(X, columns=[f"x{i}" for i in range(n_features)])
+    model = RandomForestRegressor(n_estimators=n_estimators, random_state=0)
+    model.fit(X, y)
+
+    results = {}
+    for name, kwargs in [
+        ("permutation_importance_loop", {}),
+        ("permutation_importance", {"n_jobs": n_jobs, "random_state": 0}),
+    ]:
+        np.random.seed(0)
+        tic = time.perf_counter()
+        results[name] = functions[name](
+            model, X, y, n_repeats=n_repeats, **kwargs
+        )
+        print(f"{name}: {time.perf_counter() - tic:.1f} s")
+
+    difference = np.abs(
+        results["permutation_importance_loop"]["importances_mean"]
+        - results["permutation_importance"]["importances_mean"]
+    ).max()
+    print(f"Largest difference of the mean importances: {difference:.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the permutation importance of the lesson."
+    )
+    parser.add_argument("--n-samples", type=int, default=7500)
+    parser.add_argument("--n-features", type=int, default=10)
+    parser.add_argument("--n-estimators", type=int, default=50)
+    parser.add_argument("--n-repeats", type=int, default=10)
+    parser.add_argument("--n-jobs", type=int, default=None)
+    args = parser.parse_args()
+
+    main(
+        args.n_samples,
+        args.n_features,
+        args.n_estimators,
+        args.n_repeats,
+        args.n_jobs,
+    )
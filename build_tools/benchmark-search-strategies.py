@@ -0,0 +1,221 @@
+"""
+Benchmark of the hyperparameter search strategies taught in the course.
+
+The parameter tuning notebooks tune the same `HistGradientBoostingClassifier`
+pipeline on the adult census dataset with `GridSearchCV` and
+`RandomizedSearchCV`. This script runs, for several budgets of candidates:
+
+- a grid search over `learning_rate` and `max_leaf_nodes`, with about
+  `sqrt(budget)` log-spaced values each;
+- a randomized search sampling `budget` candidates from the distributions of
+  `parameter_tuning_randomized_search.py`;
+- a successive halving randomized search starting from `budget` candidates.
+
+For each search, it records the wall time, the CPU time and the peak resident
+memory of the process and of its joblib workers, the number of fits, the best
+mean cross-validation score and the test score of the refitted best model.
+A search is on the time-vs-score frontier when no other search is both
+faster and better on the test set.
+
+The results are written to a CSV file named after the scikit-learn version,
+so that runs with different releases can be kept side by side. With
+--baseline, the wall time and test score of each search are compared to the
+ones of a previous CSV file.
+
+Usage:
+    python build_tools/benchmark-search-strategies.py --output-dir benchmarks
+    python build_tools/benchmark-search-strategies.py --budgets 4 16 \\
+        --baseline benchmarks/search-strategies-sklearn-1.6.1.csv
+"""
+
+import argparse
+import importlib
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import psutil
+import sklearn
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import (
+    GridSearchCV,
+    HalvingRandomSearchCV,
+    RandomizedSearchCV,
+    cross_val_score,
+)
+
+profiler = importlib.import_module("profile-notebooks")
+randomized_search = importlib.import_module(
+    "generate-randomized-search-results"
+)
+
+DEFAULT_BUDGETS = [4, 16, 64]
+
+
+def make_search(strategy, model, budget, cv, n_jobs):
+    """Returns the search of a strategy evaluating about budget candidates."""
+    if strategy == "grid":
+        n_values = max(int(round(np.sqrt(budget))), 1)
+        param_grid = {
+            "classifier__learning_rate": np.logspace(-2, 1, n_values),
+            "classifier__max_leaf_nodes": np.unique(
+                np.geomspace(3, 256, n_values).astype(int)
+            ),
+        }
+        return GridSearchCV(model, param_grid, cv=cv, n_jobs=n_jobs)
+    if strategy == "random":
+        return RandomizedSearchCV(
+            model,
+            randomized_search.PARAM_DISTRIBUTIONS,
+            n_iter=budget,
+            cv=cv,
+            n_jobs=n_jobs,
+            random_state=0,
+        )
+    if strategy == "halving":
+        return HalvingRandomSearchCV(
+            model,
+            randomized_search.PARAM_DISTRIBUTIONS,
+            n_candidates=budget,
+            factor=3,
+            cv=cv,
+            n_jobs=n_jobs,
+            random_state=0,
+        )
+    raise ValueError(f"Unknown search strategy {strategy!r}")
+
+
+def run_search(search, data_train, data_test, target_train, target_test):
+    """Fits a search and returns its costs and scores."""
+    process = psutil.Process()
+    cpu_before = profiler.cpu_time(process)
+    tic = time.perf_counter()
+    with profiler.MemorySampler(process) as sampler:
+        search.fit(data_train, target_train)
+    wall_time = time.perf_counter() - tic
+    return {
+        "n_candidates": len(search.cv_results_["params"]),
+        "n_fits": len(search.cv_results_["params"]) * search.n_splits_,
+        "wall_time": wall_time,
+        "cpu_time": profiler.cpu_time(process) - cpu_before,
+        "peak_rss_mb": sampler.peak_rss / 1e6,
+        "best_cv_score": search.best_score_,
+        "test_score": search.score(data_test, target_test),
+    }
+
+
+def frontier(results):
+    """Returns whether each search is on the time-vs-score frontier."""
+    wall_time = results["wall_time"].to_numpy()
+    test_score = results["test_score"].to_numpy()
+    dominated = (
+        (wall_time[None, :] <= wall_time[:, None])
+        & (test_score[None, :] >= test_score[:, None])
+        & (
+            (wall_time[None, :] < wall_time[:, None])
+            | (test_score[None, :] > test_score[:, None])
+        )
+    ).any(axis=1)
+    return ~dominated
+
+
+def compare_to_baseline(results, baseline_path):
+    baseline = pd.read_csv(baseline_path)
+    merged = results.merge(
+        baseline,
+        on=["strategy", "budget"],
+        suffixes=("", "_baseline"),
+    )
+    merged["wall_time_ratio"] = (
+        merged["wall_time"] / merged["wall_time_baseline"]
+    )
+    merged["test_score_change"] = (
+        merged["test_score"] - merged["test_score_baseline"]
+    )
+    columns = ["strategy", "budget", "wall_time_ratio", "test_score_change"]
+    return merged[columns]
+
+
+def main(budgets, strategies, cv, n_jobs, output_dir, baseline=None):
+    data_train, data_test, target_train, target_test = (
+        randomized_search.load_train_test()
+    )
+    model = randomized_search.make_model(data_train)
+    # Start the joblib workers, reused by all the searches, and import the
+    # model in them so that the first search does not pay for it
+    cross_val_score(
+        model,
+        data_train.iloc[:1000],
+        target_train.iloc[:1000],
+        cv=cv,
+        n_jobs=n_jobs,
+    )
+
+    records = []
+    for budget in budgets:
+        for strategy in strategies:
+            search = make_search(strategy, model, budget, cv, n_jobs)
+            record = run_search(
+                search, data_train, data_test, target_train, target_test
+            )
+            records.append({"strategy": strategy, "budget": budget, **record})
+            print(
+                f"{strategy:>8} budget={budget:<4} "
+                f"{record['wall_time']:8.1f}s "
+                f"test score={record['test_score']:.4f}"
+            )
+
+    results = pd.DataFrame(records)
+    results["on_frontier"] = frontier(results)
+    results["sklearn_version"] = sklearn.__version__
+    results["n_jobs"] = n_jobs
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = (
+        output_dir / f"search-strategies-sklearn-{sklearn.__version__}.csv"
+    )
+    results.to_csv(output_path, index=False)
+
+    print()
+    print(results.sort_values("wall_time").to_string(index=False))
+    print(f"\nWrote {output_path}")
+    if baseline is not None:
+        print()
+        print(compare_to_baseline(results, baseline).to_string(index=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the hyperparameter search strategies."
+    )
+    parser.add_argument(
+        "--budgets", type=int, nargs="+", default=DEFAULT_BUDGETS
+    )
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        default=["grid", "random", "halving"],
+        choices=["grid", "random", "halving"],
+    )
+    parser.add_argument("--cv", type=int, default=5)
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="number of workers of each search",
+    )
+    parser.add_argument("--output-dir", default="benchmarks")
+    parser.add_argument("--baseline", help="CSV file to compare to")
+    args = parser.parse_args()
+
+    main(
+        args.budgets,
+        args.strategies,
+        args.cv,
+        args.n_jobs,
+        args.output_dir,
+        baseline=args.baseline,
+    )
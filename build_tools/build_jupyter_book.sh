@@ -17,12 +17,10 @@ function show_error_logs {
 }
 
 affected_jupyter_book_paths() {
-    files=$(git diff --name-only origin/main...)
-    # TODO: rather than the grep pattern below we could potentially look at
-    # _toc.yml to know whether the file affects the JupyterBook
-    echo "$files" | grep python_scripts | perl -pe 's@\.py$@.html@'
-    echo "$files" | grep -P "$jupyter_book_dir/.+md$" | \
-        perl -pe "s@$jupyter_book_dir/(.+)\.md@\1.html@"
+    # Pages listed in _toc.yml whose source, or data files read by the
+    # notebook, changed
+    git diff --name-only origin/main... | \
+        python build_tools/affected-notebooks.py affected
 }
 
 write_changed_html() {
@@ -56,6 +54,10 @@ affected=$(affected_jupyter_book_paths)
 mkdir -p $jupyter_book_build_dir
 write_changed_html "$affected"
 
+# jupyter-cache only looks at the notebooks code, remove cached notebooks
+# whose data dependencies changed so that they are executed again
+python build_tools/affected-notebooks.py invalidate-cache $jupyter_book_dir/_build/.jupyter_cache
+
 make $jupyter_book_dir 2>&1 | tee $jupyter_book_dir/build.log
 
 
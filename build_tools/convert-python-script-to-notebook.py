@@ -15,20 +15,53 @@ admonitions.
 This script is taking the option 1. "Find ways to inject raw HTML into
 generated notebooks" in:
 https://github.com/executablebooks/MyST-NB/issues/148#issuecomment-632407608
+
+The script can be called with a single python script and notebook, or with a
+folder of python scripts and a folder of notebooks. In the latter case,
+conversions happen in a process pool and notebooks whose python script and
+converter are unchanged since the last conversion are skipped.
 """
 
-import sys
+import argparse
+import hashlib
 import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
 
+import docutils
 from docutils.core import publish_from_doctree
 
+import bs4
 from bs4 import BeautifulSoup
 
+import myst_parser
 from myst_parser.parsers.mdit import create_md_parser
 from myst_parser.config.main import MdParserConfig
 from myst_parser.mdit_to_docutils.base import DocutilsRenderer
 import jupytext
-
+from jupytext.jupytext import drop_text_representation_metadata
+from nbformat.v4 import nbjson
+
+# This hard-code the git repo root directory relative to this script
+root_dir = Path(__file__).parents[1]
+build_cache_dir = root_dir / ".build_cache"
+manifest_path = build_cache_dir / "notebooks.json"
+# Rendered admonitions only depend on the versions of the libraries used to
+# render them, a new cache file is used when one of them changes
+admonition_cache_path = (
+    build_cache_dir
+    / f"admonitions-docutils-{docutils.__version__}-myst-parser-{myst_parser.__version__}-bs4-{bs4.__version__}.json"
+)
+
+# Any change to this script or to jupytext invalidates the converted notebooks
+CONVERTER_VERSION = "-".join(
+    [
+        hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16],
+        jupytext.__version__,
+    ]
+)
 
 # https://www.sphinx-doc.org/en/master/usage/restructuredtext/basics.html#directives
 # Docutils supports the following directives:
@@ -63,6 +96,27 @@ sphinx_name_to_bootstrap = {
 
 all_directive_names = ["{" + adm + "}" for adm in all_admonitions]
 
+# Creating the parser is costly, it is reused for all the markdown cells
+md_parser = create_md_parser(MdParserConfig(), renderer=DocutilsRenderer)
+
+
+def read_admonition_cache():
+    if not admonition_cache_path.exists():
+        return {}
+    return json.loads(admonition_cache_path.read_text())
+
+
+def write_admonition_cache(cache):
+    build_cache_dir.mkdir(exist_ok=True)
+    admonition_cache_path.write_text(json.dumps(cache, indent=1))
+
+
+# Mapping from admonition source to its rendered HTML. Admonitions rendered by
+# this process are also stored in new_admonition_html so that worker processes
+# can send them back to the main process.
+admonition_html_cache = read_admonition_cache()
+new_admonition_html = {}
+
 
 def convert_to_html(doc, css_selector=None):
     """Converts docutils document to HTML and select part of it with CSS
@@ -98,9 +152,7 @@ def admonition_html(doc):
 
 def replace_admonition_in_cell_source(cell_str):
     """Returns cell source with admonition replaced by its generated HTML."""
-    config = MdParserConfig()
-    parser = create_md_parser(config, renderer=DocutilsRenderer)
-    tokens = parser.parse(cell_str)
+    tokens = md_parser.parse(cell_str)
 
     admonition_tokens = [
         t
@@ -114,78 +166,186 @@ def replace_admonition_in_cell_source(cell_str):
     for t in admonition_tokens:
         adm_begin, adm_end = t.map
         adm_src = "\n".join(cell_lines[adm_begin:adm_end])
-        adm_doc = parser.render(adm_src)
-        adm_html = admonition_html(adm_doc)
+        adm_html = admonition_html_cache.get(adm_src)
+        if adm_html is None:
+            adm_doc = md_parser.render(adm_src)
+            adm_html = admonition_html(adm_doc)
+            admonition_html_cache[adm_src] = adm_html
+            new_admonition_html[adm_src] = adm_html
         new_cell_str = new_cell_str.replace(adm_src, adm_html)
 
     return new_cell_str
 
 
-def replace_admonitions(nb):
-    """Replaces all admonitions by its generated HTML in a notebook object."""
+def replace_admonitions(cell_src):
+    """Replaces all admonitions by their generated HTML in a markdown cell."""
     # FIXME this would not work with advanced syntax for admonition with
     # ::: but we are not using it for now. We could parse all the markdowns
     # cell, a bit wasteful, but probably good enough
-    cells_to_modify = [
-        (i, c)
-        for i, c in enumerate(nb["cells"])
-        if c["cell_type"] == "markdown"
-        and any(directive in c["source"] for directive in all_directive_names)
-    ]
+    if not any(directive in cell_src for directive in all_directive_names):
+        return cell_src
 
-    for i, c in cells_to_modify:
-        cell_src = c["source"]
-        output_src = replace_admonition_in_cell_source(cell_src)
-        nb.cells[i]["source"] = output_src
+    return replace_admonition_in_cell_source(cell_src)
 
 
-def replace_escaped_dollars(nb):
+def replace_escaped_dollars(cell_src):
     r"""Replace escaped dollar to make Jupyter notebook interfaces happy.
 
     Jupyter interfaces wants \\$, JupyterBook wants \$. See
     https://github.com/jupyterlab/jupyterlab/issues/8645 for more details.
     """
-    cells_to_modify = [
-        (i, c)
-        for i, c in enumerate(nb["cells"])
-        if c["cell_type"] == "markdown" and "\\$" in c["source"]
-    ]
+    if "\\$" not in cell_src:
+        return cell_src
 
-    for i, c in cells_to_modify:
-        cell_src = c["source"]
-        output_src = cell_src.replace("\\$", "\\\\$")
-        nb.cells[i]["source"] = output_src
+    return cell_src.replace("\\$", "\\\\$")
+
+
+def process_cells(nb, markdown_processors):
+    """Applies all the processors to each markdown cell in a single pass.
+
+    Each processor takes the cell source and returns the new cell source.
+    """
+    for cell in nb.cells:
+        if cell["cell_type"] != "markdown":
+            continue
+        cell_src = cell["source"]
+        for processor in markdown_processors:
+            cell_src = processor(cell_src)
+        cell["source"] = cell_src
 
 
 def write_without_cell_ids(nb, output_filename):
     # In nbformat 5, markdown cells have ids, nbformat.write and consequently
     # jupytext writes random cell ids when generating .ipynb from .py, creating
-    # unnecessary changes.
-    nb_content = jupytext.writes(nb, fmt=".ipynb")
-    nb = json.loads(nb_content)
-
-    for c in nb["cells"]:
-        del c["id"]
+    # unnecessary changes. The ids are dropped before serialising the notebook
+    # which means it does not pass nbformat validation, so the JSON writer is
+    # called directly. Non-ASCII characters are escaped to keep the output
+    # identical to the one of json.dump.
+    nb = drop_text_representation_metadata(nb)
+    for c in nb.cells:
+        c.pop("id", None)
 
     with open(output_filename, "w") as f:
-        json.dump(nb, f, indent=1)
+        f.write(nbjson.writes(nb, ensure_ascii=True))
 
 
-def process_filename(replace_func_list, input_filename, output_filename):
+def process_filename(markdown_processors, input_filename, output_filename):
     nb = jupytext.read(input_filename)
+    process_cells(nb, markdown_processors)
+    write_without_cell_ids(nb, output_filename)
 
-    for replace_func in replace_func_list:
-        replace_func(nb)
 
-    write_without_cell_ids(nb, output_filename)
+MARKDOWN_PROCESSORS = [
+    replace_admonitions,
+    replace_escaped_dollars,
+]
 
 
-if __name__ == "__main__":
-    input_filename = sys.argv[1]
-    output_filename = sys.argv[2]
+def file_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
 
-    notebook_processors = [
-        replace_admonitions,
-        replace_escaped_dollars,
-    ]
-    process_filename(notebook_processors, input_filename, output_filename)
+
+def convert_file(input_filename, output_filename):
+    """Converts a single python script.
+
+    Returns the time it took and the admonitions rendered during the
+    conversion.
+    """
+    tic = time.perf_counter()
+    process_filename(MARKDOWN_PROCESSORS, input_filename, output_filename)
+    rendered = dict(new_admonition_html)
+    new_admonition_html.clear()
+    return time.perf_counter() - tic, rendered
+
+
+def read_manifest():
+    if not manifest_path.exists():
+        return {}
+    return json.loads(manifest_path.read_text())
+
+
+def write_manifest(manifest):
+    build_cache_dir.mkdir(exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+
+
+def convert_folder(input_folder, output_folder, n_jobs=None, force=False):
+    """Converts all the python scripts of a folder to notebooks.
+
+    Notebooks are skipped when the content of their python script and the
+    converter version match the ones recorded in the manifest at the time of
+    the previous conversion.
+    """
+    manifest = read_manifest()
+    to_convert = []
+    n_skipped = 0
+    for input_path in sorted(Path(input_folder).glob("*.py")):
+        output_path = (
+            Path(output_folder) / input_path.with_suffix(".ipynb").name
+        )
+        key = os.path.relpath(output_path, root_dir)
+        entry = {
+            "source_hash": file_hash(input_path),
+            "converter_version": CONVERTER_VERSION,
+        }
+        if not force and output_path.exists() and manifest.get(key) == entry:
+            n_skipped += 1
+            continue
+        to_convert.append((input_path, output_path, key, entry))
+
+    print(
+        f"Converting {len(to_convert)} python scripts, {n_skipped} notebooks"
+        " are up to date"
+    )
+    tic = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        futures = {
+            executor.submit(convert_file, input_path, output_path): (
+                input_path,
+                key,
+                entry,
+            )
+            for input_path, output_path, key, entry in to_convert
+        }
+        try:
+            for future in as_completed(futures):
+                input_path, key, entry = futures[future]
+                duration, rendered = future.result()
+                manifest[key] = entry
+                admonition_html_cache.update(rendered)
+                print(f"{duration:6.2f}s {input_path}")
+        finally:
+            # Record successful conversions even if one of them failed
+            write_manifest(manifest)
+            write_admonition_cache(admonition_html_cache)
+
+    print(f"Total: {time.perf_counter() - tic:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert python scripts to notebooks."
+    )
+    parser.add_argument("input", help="python script or folder")
+    parser.add_argument("output", help="notebook or folder")
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes when converting folders",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="convert all python scripts even if they did not change",
+    )
+    args = parser.parse_args()
+
+    if Path(args.input).is_dir():
+        convert_folder(
+            args.input, args.output, n_jobs=args.n_jobs, force=args.force
+        )
+    else:
+        process_filename(MARKDOWN_PROCESSORS, args.input, args.output)
+        if new_admonition_html:
+            write_admonition_cache(admonition_html_cache)
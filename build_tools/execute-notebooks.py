@@ -0,0 +1,209 @@
+"""
+Execute the notebooks of the JupyterBook in parallel and store them in the
+jupyter-cache database used by jupyter-book.
+
+jupyter-book executes the notebooks one after the other. Running this script
+before `jupyter-book build` executes all the notebooks that are not in the
+cache in a pool of worker processes, so that jupyter-book only has to read
+the outputs from the cache.
+
+Each notebook runs the parallel loops of its cells with `--jobs` workers, 1
+by default. The value is exported to the kernels as `SKLEARN_MOOC_N_JOBS`,
+read by the `compute_config` package of the notebooks, with the same limit
+on their BLAS threads. The pool is capped so that the notebooks executed at
+once do not use more than the number of cores in total.
+
+Notebooks are read and executed the same way as jupyter-book does with
+`execute_notebooks: cache` so that the cached notebooks match the ones
+jupyter-book looks for. Each notebook runs in a new kernel to keep notebooks
+independent from each other. The execution time of each notebook is recorded
+next to the cache database and the longest notebooks are scheduled first, so
+that a long notebook does not end up running alone at the end of the build.
+Notebooks without recorded timings are scheduled first.
+
+Notebooks that fail are not cached, jupyter-book executes them again and
+reports the errors in its logs.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import jupytext
+import yaml
+
+from jupyter_cache import get_cache
+from jupyter_cache.base import CacheBundleIn
+from jupyter_cache.executors.utils import single_nb_execution
+
+affected_notebooks = importlib.import_module("affected-notebooks")
+
+# This hard-code the git repo root directory relative to this script
+root_dir = Path(__file__).parents[1]
+jupyter_book_dir = root_dir / "jupyter-book"
+TIMINGS_FILENAME = "execution-timings.json"
+# Read by the compute_config package of the notebooks
+KERNEL_N_JOBS_ENV_VARS = ["SKLEARN_MOOC_N_JOBS", "SKLEARN_MOOC_BLAS_THREADS"]
+
+
+def read_notebook(path):
+    # Same reader as nb_custom_formats in jupyter-book/_config.yml
+    return jupytext.reads(Path(path).read_text(), fmt="py:percent")
+
+
+def execute_notebook(path, timeout):
+    """Executes a notebook in its folder.
+
+    Returns the executed notebook, the execution time and the traceback if
+    the execution failed.
+    """
+    nb = read_notebook(path)
+    result = single_nb_execution(
+        nb,
+        cwd=str(Path(path).parent),
+        timeout=timeout,
+        allow_errors=False,
+    )
+    return result.nb, result.time, result.exc_string
+
+
+def set_kernel_n_jobs(jobs):
+    """Sets the parallelism of the kernels started by the worker process."""
+    for env_var in KERNEL_N_JOBS_ENV_VARS:
+        os.environ[env_var] = str(jobs)
+
+
+def get_pool_size(n_jobs=None, jobs=1):
+    """Returns the number of notebooks executed at once.
+
+    It is at most `n_jobs`, and small enough for the notebooks to use at most
+    the number of cores with `jobs` workers each.
+    """
+    n_cores = os.cpu_count() or 1
+    max_pool_size = max(n_cores // jobs, 1)
+    if n_jobs is None:
+        return max_pool_size
+    return min(n_jobs, max_pool_size)
+
+
+def read_timings(cache_dir):
+    timings_path = Path(cache_dir) / TIMINGS_FILENAME
+    if not timings_path.exists():
+        return {}
+    return json.loads(timings_path.read_text())
+
+
+def write_timings(cache_dir, timings):
+    timings_path = Path(cache_dir) / TIMINGS_FILENAME
+    timings_path.write_text(json.dumps(timings, indent=1, sort_keys=True))
+
+
+def get_notebooks_to_execute(cache, force=False):
+    """Returns (docname, path) of the JupyterBook notebooks that are not in
+    the cache.
+    """
+    to_execute = []
+    for docname in affected_notebooks.get_dependency_graph():
+        path = jupyter_book_dir / f"{docname}.py"
+        if not force:
+            try:
+                cache.match_cache_notebook(read_notebook(path))
+                continue
+            except KeyError:
+                pass
+        to_execute.append((docname, path))
+    return to_execute
+
+
+def execute_all(cache_dir, n_jobs=None, jobs=1, force=False):
+    config = yaml.safe_load((jupyter_book_dir / "_config.yml").read_text())
+    timeout = config["execute"]["timeout"]
+
+    cache = get_cache(cache_dir)
+    timings = read_timings(cache_dir)
+    to_execute = get_notebooks_to_execute(cache, force=force)
+    # The pool runs the notebooks in submission order
+    to_execute.sort(
+        key=lambda item: -timings.get(item[0], float("inf")),
+    )
+
+    pool_size = get_pool_size(n_jobs, jobs)
+    print(
+        f"Executing {len(to_execute)} notebooks with {pool_size} workers,"
+        f" {jobs} jobs per notebook"
+    )
+    failed = []
+    tic = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=pool_size,
+        initializer=set_kernel_n_jobs,
+        initargs=(jobs,),
+    ) as executor:
+        futures = {
+            executor.submit(execute_notebook, path, timeout): (docname, path)
+            for docname, path in to_execute
+        }
+        try:
+            for future in as_completed(futures):
+                docname, path = futures[future]
+                nb, duration, exc_string = future.result()
+                if exc_string is not None:
+                    print(f"Executing {docname} failed:\n{exc_string}")
+                    failed.append(docname)
+                    continue
+                cache.cache_notebook_bundle(
+                    CacheBundleIn(
+                        nb,
+                        str(path),
+                        data={"execution_seconds": duration},
+                    ),
+                    check_validity=False,
+                    overwrite=True,
+                )
+                timings[docname] = duration
+                print(f"{duration:7.2f}s {docname}")
+        finally:
+            write_timings(cache_dir, timings)
+
+    print(f"Total: {time.perf_counter() - tic:.2f}s")
+    if failed:
+        print(
+            f"{len(failed)} notebooks failed, they are left to jupyter-book:"
+            f" {failed}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Execute the JupyterBook notebooks into jupyter-cache."
+    )
+    parser.add_argument("cache_dir", help="jupyter-cache folder")
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=None,
+        help=(
+            "maximum number of notebooks executed in parallel, the number of"
+            " cores divided by --jobs by default"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of workers of the parallel loops of each notebook",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="execute all the notebooks even if they are in the cache",
+    )
+    args = parser.parse_args()
+
+    execute_all(
+        args.cache_dir, n_jobs=args.n_jobs, jobs=args.jobs, force=args.force
+    )
@@ -0,0 +1,242 @@
+"""
+Generate figures/randomized_search_results.csv.
+
+The file holds the `cv_results_` of the 500 iterations randomized search of
+`parameter_tuning_randomized_search.py`, loaded by that notebook and by
+`parameter_tuning_parallel_plot.py`. Running the search takes hours on a
+single core, so this script:
+
+- samples the candidates with a fixed random state, so that a run always
+  evaluates the same candidates;
+- evaluates the candidates in a pool of worker processes sized to the number
+  of cores, each task running the 5-fold cross-validation of one candidate;
+- writes the result of each candidate to a JSON file of a checkpoint folder
+  as soon as it is evaluated. An interrupted run restarted with the same
+  options only evaluates the candidates without a checkpoint. The checkpoint
+  folder name contains a hash of the options and of the scikit-learn version,
+  so that upgrading scikit-learn evaluates all the candidates again.
+
+The CSV file has the columns of `RandomizedSearchCV.cv_results_`, one row per
+candidate in sampling order. Apart from the timing columns, rerunning the
+script with the same scikit-learn version writes the same file.
+
+Usage:
+    python build_tools/generate-randomized-search-results.py
+    python build_tools/generate-randomized-search-results.py --n-jobs 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import sklearn
+from joblib import Parallel, delayed
+from scipy.stats import loguniform, rankdata
+from sklearn.base import clone
+from sklearn.compose import make_column_selector as selector
+from sklearn.compose import make_column_transformer
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.model_selection import (
+    ParameterSampler,
+    StratifiedKFold,
+    train_test_split,
+)
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OrdinalEncoder
+
+# This hard-code the git repo root directory relative to this script
+root_dir = Path(__file__).parents[1]
+sys.path.insert(0, str(root_dir / "python_scripts"))
+
+from dataset_tools import read_csv
+
+OUTPUT_PATH = root_dir / "figures" / "randomized_search_results.csv"
+CHECKPOINT_ROOT = root_dir / ".build_cache" / "randomized_search_results"
+N_SPLITS = 5
+
+
+class loguniform_int:
+    """Integer valued version of the log-uniform distribution"""
+
+    def __init__(self, a, b):
+        self._distribution = loguniform(a, b)
+
+    def rvs(self, *args, **kwargs):
+        """Random variable sample"""
+        return self._distribution.rvs(*args, **kwargs).astype(int)
+
+
+PARAM_DISTRIBUTIONS = {
+    "classifier__l2_regularization": loguniform(1e-6, 1e3),
+    "classifier__learning_rate": loguniform(0.001, 10),
+    "classifier__max_leaf_nodes": loguniform_int(2, 256),
+    "classifier__min_samples_leaf": loguniform_int(1, 100),
+    "classifier__max_bins": loguniform_int(2, 255),
+}
+
+
+def load_train_test():
+    """Returns the train-test split of parameter_tuning_randomized_search.py
+    as data_train, data_test, target_train, target_test.
+    """
+    adult_census = read_csv(root_dir / "datasets" / "adult-census.csv")
+    target_name = "class"
+    target = adult_census[target_name]
+    data = adult_census.drop(columns=[target_name, "education-num"])
+    return train_test_split(data, target, random_state=42)
+
+
+def load_data():
+    """Returns the training set of parameter_tuning_randomized_search.py."""
+    data_train, _, target_train, _ = load_train_test()
+    return data_train, target_train
+
+
+def make_model(data):
+    """Returns the model of parameter_tuning_randomized_search.py."""
+    categorical_columns = selector(dtype_include=object)(data)
+    preprocessor = make_column_transformer(
+        (
+            OrdinalEncoder(
+                handle_unknown="use_encoded_value", unknown_value=-1
+            ),
+            categorical_columns,
+        ),
+        remainder="passthrough",
+    )
+    return Pipeline(
+        [
+            ("preprocessor", preprocessor),
+            (
+                "classifier",
+                HistGradientBoostingClassifier(
+                    random_state=42, max_leaf_nodes=4
+                ),
+            ),
+        ]
+    )
+
+
+def sample_candidates(n_iter, random_state):
+    """Returns the candidates as dicts of Python scalars."""
+    sampler = ParameterSampler(
+        PARAM_DISTRIBUTIONS, n_iter=n_iter, random_state=random_state
+    )
+    return [
+        {name: value.item() for name, value in params.items()}
+        for params in sampler
+    ]
+
+
+def checkpoint_dir(n_iter, random_state):
+    options = f"{n_iter}-{random_state}-{N_SPLITS}-{sklearn.__version__}"
+    digest = hashlib.sha256(options.encode()).hexdigest()[:16]
+    return CHECKPOINT_ROOT / digest
+
+
+def evaluate_candidate(model, params, data, target, splits, path):
+    """Cross-validates a candidate and writes the result to path."""
+    record = {"params": params, "fit_time": [], "score_time": [], "score": []}
+    for train, test in splits:
+        estimator = clone(model).set_params(**params)
+        tic = time.perf_counter()
+        estimator.fit(data.iloc[train], target.iloc[train])
+        record["fit_time"].append(time.perf_counter() - tic)
+        tic = time.perf_counter()
+        score = estimator.score(data.iloc[test], target.iloc[test])
+        record["score_time"].append(time.perf_counter() - tic)
+        record["score"].append(score)
+
+    # Write to a temporary file first so that an interrupted run never leaves
+    # a partially written checkpoint
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(record, f)
+    os.replace(tmp_path, path)
+
+
+def to_cv_results(records):
+    """Returns the records in the format of `cv_results_`."""
+    fit_times = np.array([record["fit_time"] for record in records])
+    score_times = np.array([record["score_time"] for record in records])
+    scores = np.array([record["score"] for record in records])
+    params = [record["params"] for record in records]
+
+    cv_results = {
+        "mean_fit_time": fit_times.mean(axis=1),
+        "std_fit_time": fit_times.std(axis=1),
+        "mean_score_time": score_times.mean(axis=1),
+        "std_score_time": score_times.std(axis=1),
+    }
+    for name in sorted(PARAM_DISTRIBUTIONS):
+        cv_results[f"param_{name}"] = [p[name] for p in params]
+    cv_results["params"] = params
+    for split_idx in range(scores.shape[1]):
+        cv_results[f"split{split_idx}_test_score"] = scores[:, split_idx]
+    mean_scores = scores.mean(axis=1)
+    cv_results["mean_test_score"] = mean_scores
+    cv_results["std_test_score"] = scores.std(axis=1)
+    cv_results["rank_test_score"] = rankdata(
+        -mean_scores, method="min"
+    ).astype(np.int32)
+    return pd.DataFrame(cv_results)
+
+
+def generate(n_iter, random_state, n_jobs, output_path):
+    data, target = load_data()
+    model = make_model(data)
+    candidates = sample_candidates(n_iter, random_state)
+    splits = list(StratifiedKFold(N_SPLITS).split(data, target))
+
+    folder = checkpoint_dir(n_iter, random_state)
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = [folder / f"candidate-{idx:04d}.json" for idx in range(n_iter)]
+    pending = [idx for idx, path in enumerate(paths) if not path.exists()]
+    print(
+        f"{n_iter - len(pending)} of {n_iter} candidates found in {folder}, "
+        f"evaluating {len(pending)} with n_jobs={n_jobs}"
+    )
+
+    tic = time.perf_counter()
+    Parallel(n_jobs=n_jobs, verbose=10)(
+        delayed(evaluate_candidate)(
+            model, candidates[idx], data, target, splits, paths[idx]
+        )
+        for idx in pending
+    )
+    print(f"Evaluated {len(pending)} in {time.perf_counter() - tic:.1f}s")
+
+    records = [json.loads(path.read_text()) for path in paths]
+    cv_results = to_cv_results(records)
+    cv_results.to_csv(output_path)
+    print(f"Wrote {output_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate figures/randomized_search_results.csv."
+    )
+    parser.add_argument("--n-iter", type=int, default=500)
+    parser.add_argument(
+        "--random-state",
+        type=int,
+        default=0,
+        help="random state of the sampling of the candidates",
+    )
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=-1,
+        help="number of candidates evaluated in parallel",
+    )
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args()
+
+    generate(args.n_iter, args.random_state, args.n_jobs, args.output)
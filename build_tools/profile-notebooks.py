@@ -0,0 +1,272 @@
+"""
+Profile the execution of the python scripts cell by cell.
+
+Each python script is executed as a notebook, one cell at a time, and for each
+cell the following are recorded:
+- wall time
+- CPU time of the kernel and of its child processes, e.g. joblib workers
+- peak resident memory of the kernel and of its child processes, sampled while
+  the cell runs
+
+Notebooks are executed one after the other to keep timings comparable. The
+results are written as a JSON report and as an HTML report with a table that
+can be sorted by clicking on the column headers.
+
+With --baseline, the report is compared to a previous JSON report and the
+script exits with a non-zero status when a cell got slower than the threshold.
+Cells are matched by notebook and source, so that edited cells are not
+compared.
+
+Usage:
+    python build_tools/profile-notebooks.py python_scripts --output-dir profile
+    python build_tools/profile-notebooks.py python_scripts/ensemble_*.py \\
+        --output-dir profile --baseline profile-main/profile.json --threshold 20
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import jupytext
+import psutil
+from nbclient import NotebookClient
+
+
+SAMPLING_INTERVAL = 0.05
+
+
+class MemorySampler:
+    """Samples in a thread the resident memory of a process and its children
+    and keeps the maximum.
+    """
+
+    def __init__(self, process):
+        self.process = process
+        self.peak_rss = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _rss(self):
+        processes = [self.process] + self.process.children(recursive=True)
+        rss = 0
+        for p in processes:
+            try:
+                rss += p.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+        return rss
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_rss = max(self.peak_rss, self._rss())
+            self._stop.wait(SAMPLING_INTERVAL)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, self._rss())
+
+
+def cpu_time(process):
+    """Returns the CPU time of a process and of its children."""
+    times = process.cpu_times()
+    total = (
+        times.user + times.system + times.children_user + times.children_system
+    )
+    for child in process.children(recursive=True):
+        try:
+            child_times = child.cpu_times()
+        except psutil.NoSuchProcess:
+            continue
+        total += child_times.user + child_times.system
+    return total
+
+
+def cell_key(notebook, source):
+    return f"{notebook}:{hashlib.sha256(source.encode()).hexdigest()[:16]}"
+
+
+def profile_notebook(path, timeout):
+    """Executes a python script cell by cell and returns one record per code
+    cell.
+    """
+    path = Path(path)
+    nb = jupytext.read(path)
+    client = NotebookClient(
+        nb,
+        timeout=timeout,
+        kernel_name="python3",
+        resources={"metadata": {"path": str(path.parent)}},
+    )
+    records = []
+    with client.setup_kernel():
+        kernel_process = psutil.Process(client.km.provisioner.process.pid)
+        for index, cell in enumerate(nb.cells):
+            if cell.cell_type != "code":
+                continue
+            cpu_before = cpu_time(kernel_process)
+            tic = time.perf_counter()
+            with MemorySampler(kernel_process) as sampler:
+                client.execute_cell(cell, index)
+            records.append(
+                {
+                    "key": cell_key(path.name, cell.source),
+                    "notebook": path.name,
+                    "cell": index,
+                    "first_line": cell.source.strip().split("\n")[0],
+                    "wall_time": time.perf_counter() - tic,
+                    "cpu_time": cpu_time(kernel_process) - cpu_before,
+                    "peak_rss_mb": sampler.peak_rss / 1e6,
+                }
+            )
+    return records
+
+
+def write_html_report(records, output_path):
+    columns = [
+        "notebook",
+        "cell",
+        "first_line",
+        "wall_time",
+        "cpu_time",
+        "peak_rss_mb",
+    ]
+    rows = []
+    for record in records:
+        cells = []
+        for column in columns:
+            value = record[column]
+            if isinstance(value, float):
+                cells.append(f'<td data-value="{value}">{value:.2f}</td>')
+            else:
+                cells.append(
+                    f'<td data-value="{html.escape(str(value))}">'
+                    f"{html.escape(str(value))}</td>"
+                )
+        rows.append(f"<tr>{''.join(cells)}</tr>")
+    headers = "".join(f"<th>{column}</th>" for column in columns)
+    output_path.write_text(
+        f"""<html>
+<head>
+<style>
+table {{ border-collapse: collapse; font-family: monospace; }}
+th, td {{ border: 1px solid #ccc; padding: 2px 6px; text-align: left; }}
+th {{ cursor: pointer; background: #eee; }}
+</style>
+</head>
+<body>
+<table>
+<thead><tr>{headers}</tr></thead>
+<tbody>
+{chr(10).join(rows)}
+</tbody>
+</table>
+<script>
+// Sort by a column when clicking on its header, numbers in decreasing order
+document.querySelectorAll("th").forEach((th, column) => {{
+  th.addEventListener("click", () => {{
+    const tbody = document.querySelector("tbody");
+    const rows = Array.from(tbody.rows);
+    const value = (row) => row.cells[column].dataset.value;
+    const numeric = rows.every((row) => !isNaN(parseFloat(value(row))));
+    rows.sort((a, b) => numeric
+      ? parseFloat(value(b)) - parseFloat(value(a))
+      : value(a).localeCompare(value(b)));
+    rows.forEach((row) => tbody.appendChild(row));
+  }});
+}});
+</script>
+</body>
+</html>
+"""
+    )
+
+
+def find_regressions(records, baseline_records, threshold, min_time):
+    """Returns the cells whose wall time increased by more than threshold
+    percent compared to the baseline.
+
+    Cells that took less than min_time seconds in the baseline are ignored
+    since their timings are dominated by noise.
+    """
+    baseline = {record["key"]: record for record in baseline_records}
+    regressions = []
+    for record in records:
+        previous = baseline.get(record["key"])
+        if previous is None or previous["wall_time"] < min_time:
+            continue
+        increase = 100 * (record["wall_time"] / previous["wall_time"] - 1)
+        if increase > threshold:
+            regressions.append((record, previous, increase))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Profile the python scripts cell by cell."
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="python scripts or folders of python scripts"
+    )
+    parser.add_argument("--output-dir", default="profile")
+    parser.add_argument(
+        "--timeout", type=int, default=300, help="timeout of each cell"
+    )
+    parser.add_argument("--baseline", help="JSON report to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20,
+        help="maximum wall time increase in percent compared to the baseline",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=1.0,
+        help="ignore cells faster than this in the baseline, in seconds",
+    )
+    args = parser.parse_args()
+
+    script_paths = []
+    for path in map(Path, args.paths):
+        if path.is_dir():
+            script_paths.extend(sorted(path.glob("*.py")))
+        else:
+            script_paths.append(path)
+
+    records = []
+    for path in script_paths:
+        tic = time.perf_counter()
+        records.extend(profile_notebook(path, args.timeout))
+        print(f"{time.perf_counter() - tic:7.2f}s {path}")
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "profile.json").write_text(json.dumps(records, indent=1))
+    write_html_report(records, output_dir / "profile.html")
+    print(f"Reports written to {output_dir}")
+
+    if args.baseline is not None:
+        baseline_records = json.loads(Path(args.baseline).read_text())
+        regressions = find_regressions(
+            records, baseline_records, args.threshold, args.min_time
+        )
+        for record, previous, increase in regressions:
+            print(
+                f"{record['notebook']} cell {record['cell']}"
+                f" ({record['first_line']}):"
+                f" {previous['wall_time']:.2f}s -> {record['wall_time']:.2f}s"
+                f" (+{increase:.0f}%)"
+            )
+        if regressions:
+            sys.exit(1)
+        print("No cell is slower than the baseline")
@@ -0,0 +1,9 @@
+"""Helpers shared by the clustering lessons."""
+
+from .silhouette import silhouette_scores
+from .sweep import n_clusters_sweep
+
+__all__ = [
+    "n_clusters_sweep",
+    "silhouette_scores",
+]
@@ -0,0 +1,197 @@
+"""Sweep of the number of clusters of a clustering model.
+
+Choosing `n_clusters` usually means fitting the same model for a range of
+values, possibly on several resamplings of the data to check the stability of
+the result. All the `(resample, n_clusters)` fits are independent, so they are
+run as a single grid of tasks on a joblib process pool. The whole data is
+passed to every task, with the indices of its resample. Large NumPy arrays are
+memory-mapped by joblib so that the workers share them, but DataFrames, kept so
+that pipelines can select columns by name, are pickled and sent with every
+task. The silhouette scores of all the values of `n_clusters` of a resample
+are computed together, so that the pairwise distances between its samples are
+only computed once.
+
+Fitted models can be memoized with a `joblib.Memory`. The cache key contains
+the parameters of the model and a hash of the data it is fitted on, so
+re-executing a notebook, or sweeping again over overlapping values of
+`n_clusters`, only fits the new combinations.
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Memory, Parallel, delayed
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split
+
+from .silhouette import silhouette_scores
+
+
+def _take(data, indices):
+    if hasattr(data, "iloc"):
+        # Keep the column names, used by some pipelines to select columns
+        return data.iloc[indices]
+    return data[indices]
+
+
+def _split_model(model):
+    """Returns the preprocessing steps, or None, and the clustering step."""
+    if hasattr(model, "steps"):
+        return model[:-1], model[-1]
+    return None, model
+
+
+def _fit(model, data, n_clusters):
+    model = clone(model)
+    _split_model(model)[1].set_params(n_clusters=n_clusters)
+    return model.fit(data)
+
+
+def _fit_labels(fit, model, data, train_indices, test_indices, n_clusters):
+    """Fits the model on the train indices and labels the test indices, or
+    the train indices if test_indices is None.
+    """
+    fitted_model = fit(model, _take(data, train_indices), n_clusters)
+    clustering_model = _split_model(fitted_model)[1]
+    if test_indices is None:
+        labels = clustering_model.labels_
+    else:
+        labels = fitted_model.predict(_take(data, test_indices))
+    return {
+        "n_clusters": n_clusters,
+        "inertia": getattr(clustering_model, "inertia_", np.nan),
+        "labels": labels,
+    }
+
+
+def _silhouettes(model, data, train_indices, test_indices, labelings):
+    """Returns the silhouette score of each labeling of the evaluated data,
+    or NaN where it is not defined.
+    """
+    eval_data = _take(
+        data, train_indices if test_indices is None else test_indices
+    )
+    preprocessor = _split_model(model)[0]
+    if preprocessor is not None:
+        # Only the last step depends on n_clusters, the preprocessing is the
+        # same for all the labelings
+        preprocessor = clone(preprocessor).fit(_take(data, train_indices))
+        eval_data = preprocessor.transform(eval_data)
+
+    scores = np.full(len(labelings), np.nan)
+    # The silhouette is only defined for 2 <= n_labels <= n_samples - 1
+    defined = np.array(
+        [2 <= np.unique(labels).size < len(labels) for labels in labelings]
+    )
+    if any(defined):
+        scores[defined] = silhouette_scores(
+            eval_data,
+            [labels for labels, ok in zip(labelings, defined) if ok],
+        )
+    return scores
+
+
+def n_clusters_sweep(
+    model,
+    data,
+    n_clusters_values=range(2, 11),
+    resampling_random_states=None,
+    train_size=0.5,
+    eval_set="train",
+    n_jobs=None,
+    memory=None,
+):
+    """Fits a clustering model for each number of clusters and resampling.
+
+    Parameters
+    ----------
+    model : estimator or Pipeline
+        Clustering model, or pipeline whose last step is a clustering model,
+        with a `n_clusters` parameter. The silhouette is computed on the data
+        transformed by the previous steps of the pipeline.
+    data : array-like or DataFrame
+        The data to cluster.
+    n_clusters_values : iterable of int, default=range(2, 11)
+        Values of `n_clusters` to try.
+    resampling_random_states : iterable of int, default=None
+        If None, the model is fitted on the whole data. Otherwise, for each
+        value, the data is split with `train_test_split(data,
+        train_size=train_size, random_state=value)`.
+    train_size : float or int, default=0.5
+        Size of the resampled data, see `train_test_split`.
+    eval_set : {"train", "test"}, default="train"
+        Whether the scores and labels are computed on the data the model is
+        fitted on, or on the held-out part of the split.
+    n_jobs : int, default=None
+        Number of workers used to run the grid of fits.
+    memory : str, Path or joblib.Memory, default=None
+        Where to memoize the fitted models. None disables memoization.
+
+    Returns
+    -------
+    results : DataFrame
+        One row per `(resample, n_clusters)` with the columns "resample" (the
+        random state, or None), "n_clusters", "inertia" (NaN for models
+        without an `inertia_` attribute), "silhouette" and "labels" (array of
+        cluster labels of the evaluated samples).
+    """
+    if eval_set not in ("train", "test"):
+        raise ValueError(
+            f"eval_set must be either 'train' or 'test', got {eval_set!r}"
+        )
+    if eval_set == "test" and resampling_random_states is None:
+        raise ValueError(
+            "eval_set='test' requires resampling_random_states to be set"
+        )
+
+    n_clusters_values = list(n_clusters_values)
+    if not hasattr(data, "iloc"):
+        data = np.asarray(data)
+
+    indices = np.arange(data.shape[0])
+    if resampling_random_states is None:
+        resamples = [(None, indices, None)]
+    else:
+        resamples = []
+        for random_state in resampling_random_states:
+            train_indices, test_indices = train_test_split(
+                indices, train_size=train_size, random_state=random_state
+            )
+            if eval_set == "train":
+                test_indices = None
+            resamples.append((random_state, train_indices, test_indices))
+
+    if not isinstance(memory, Memory):
+        memory = Memory(memory, verbose=0)
+    fit = memory.cache(_fit)
+
+    tasks = [
+        (random_state, train_indices, test_indices, n_clusters)
+        for random_state, train_indices, test_indices in resamples
+        for n_clusters in n_clusters_values
+    ]
+    with Parallel(n_jobs=n_jobs) as parallel:
+        results = parallel(
+            delayed(_fit_labels)(
+                fit, model, data, train_indices, test_indices, n_clusters
+            )
+            for _, train_indices, test_indices, n_clusters in tasks
+        )
+        results = pd.DataFrame(results)
+        results.insert(0, "resample", [task[0] for task in tasks])
+
+        # The pairwise distances of each resample are computed once for all
+        # the values of n_clusters
+        labels = results["labels"].tolist()
+        n_values = len(n_clusters_values)
+        silhouettes = parallel(
+            delayed(_silhouettes)(
+                model,
+                data,
+                train_indices,
+                test_indices,
+                labels[i * n_values : (i + 1) * n_values],
+            )
+            for i, (_, train_indices, test_indices) in enumerate(resamples)
+        )
+    results.insert(3, "silhouette", np.concatenate(silhouettes))
+    return results
@@ -0,0 +1,24 @@
+"""Parallelism settings shared by the notebooks.
+
+Importing this package applies the thread limits of the profile of the
+current environment. Notebooks pass `N_JOBS` to their outermost parallel loop
+and `ESTIMATOR_N_JOBS` to the estimators nested inside it.
+"""
+
+from .profiles import PROFILES, Profile, apply_profile, get_profile
+
+PROFILE = get_profile()
+N_JOBS = PROFILE.n_jobs
+ESTIMATOR_N_JOBS = PROFILE.estimator_n_jobs
+
+apply_profile(PROFILE)
+
+__all__ = [
+    "ESTIMATOR_N_JOBS",
+    "N_JOBS",
+    "PROFILE",
+    "PROFILES",
+    "Profile",
+    "apply_profile",
+    "get_profile",
+]
@@ -0,0 +1,26 @@
+"""Helpers to load the datasets used in the course."""
+
+from .cache import read_csv
+from .embeddings import encode_text
+from .prices import load_price_panel
+from .registry import DATASETS, load_dataset
+from .rides import (
+    iter_ride_chunks,
+    iter_rolling_features,
+    resample_rides,
+    ride_groups,
+    ride_summary,
+)
+
+__all__ = [
+    "DATASETS",
+    "encode_text",
+    "iter_ride_chunks",
+    "iter_rolling_features",
+    "load_dataset",
+    "load_price_panel",
+    "read_csv",
+    "resample_rides",
+    "ride_groups",
+    "ride_summary",
+]
@@ -0,0 +1,134 @@
+"""Columnar cache of the CSV files used in the course.
+
+Parsing a CSV file is much slower than reading a binary columnar file. The
+first time a CSV file is read with a given set of options, the parsed
+dataframe is stored in an uncompressed Feather file in a `.cache` folder next
+to the CSV file. Later reads memory-map the Feather file, so categorical
+columns, parsed timestamps and the index are restored without parsing the
+text again.
+
+The cache file name contains a hash of the content of the CSV file and a hash
+of the reading options, so that editing the CSV file invalidates its cached
+versions.
+
+Feather files are read with pyarrow. When pyarrow is not installed, e.g. in
+JupyterLite, the CSV file is parsed with pandas as usual.
+
+The cache folder of the datasets folder and the atomic writes are shared with
+the other caches of the package, for the encoded texts and the price panels.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow
+    from pyarrow import feather
+except ImportError:
+    pyarrow = None
+
+CACHE_DIRNAME = ".cache"
+# The datasets folder is a sibling of the python_scripts and notebooks folders
+DATA_DIR = Path(__file__).parents[2] / "datasets"
+# Files derived from several CSV files, e.g. encoded texts or price panels
+CACHE_DIR = DATA_DIR / CACHE_DIRNAME
+
+
+def write_atomic(write, path):
+    """Writes a file by calling `write` on a temporary file, then renames it.
+
+    Notebooks executed in parallel share the cache, so they never read a
+    partially written file.
+
+    Parameters
+    ----------
+    write : callable
+        Called with the temporary file opened in binary mode.
+    path : Path
+        Path of the file. Its folder is created if needed.
+    """
+    path.parent.mkdir(exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _hash_options(read_csv_kwargs):
+    options = repr(sorted(read_csv_kwargs.items())) + pd.__version__
+    return hashlib.sha256(options.encode()).hexdigest()[:16]
+
+
+def _hash_file(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()[:16]
+
+
+def cache_path(filepath, **read_csv_kwargs):
+    """Returns the path of the cached version of a CSV file."""
+    filepath = Path(filepath)
+    file_hash = _hash_file(filepath)
+    options_hash = _hash_options(read_csv_kwargs)
+    filename = f"{filepath.stem}-{file_hash}-{options_hash}.feather"
+    return filepath.parent / CACHE_DIRNAME / filename
+
+
+def _write_cache(df, path):
+    table = pyarrow.Table.from_pandas(df, preserve_index=True)
+    write_atomic(
+        lambda f: feather.write_feather(table, f, compression="uncompressed"),
+        path,
+    )
+
+    # Cached versions of previous contents of the CSV file are stale
+    stem, source_hash, _ = path.stem.rsplit("-", 2)
+    for stale_path in path.parent.glob(f"{stem}-*.feather"):
+        other_stem, other_source_hash, _ = stale_path.stem.rsplit("-", 2)
+        if other_stem == stem and other_source_hash != source_hash:
+            stale_path.unlink(missing_ok=True)
+
+
+def read_csv(filepath, zero_copy=False, **read_csv_kwargs):
+    """Reads a CSV file like `pandas.read_csv` using the columnar cache.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path of the CSV file. Other inputs, e.g. URLs or buffers, are passed
+        to `pandas.read_csv` without caching.
+    zero_copy : bool, default=False
+        If True, numeric columns share the memory of the memory-mapped file
+        instead of being copied. They are read-only: modifying their values in
+        place raises an error.
+    **read_csv_kwargs
+        Keyword arguments passed to `pandas.read_csv` when the CSV file is
+        parsed. They are part of the cache key.
+
+    Returns
+    -------
+    df : DataFrame
+    """
+    if pyarrow is None or not isinstance(filepath, (str, Path)):
+        return pd.read_csv(filepath, **read_csv_kwargs)
+    if not Path(filepath).is_file():
+        return pd.read_csv(filepath, **read_csv_kwargs)
+
+    path = cache_path(filepath, **read_csv_kwargs)
+    if not path.exists():
+        df = pd.read_csv(filepath, **read_csv_kwargs)
+        try:
+            _write_cache(df, path)
+        except OSError:
+            # e.g. read-only file system, the cache is only an optimization
+            return df
+
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(split_blocks=zero_copy)
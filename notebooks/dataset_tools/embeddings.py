@@ -0,0 +1,141 @@
+"""Cache of the encoded text columns used in the course.
+
+Encoding a text corpus, e.g. with skrub's `StringEncoder`, takes much longer
+than the models fitted on the encoded matrix. The first time a corpus is
+encoded with a given encoder, the result is stored in the `.cache` folder of
+the datasets folder: dense outputs as a float32 NumPy file that is
+memory-mapped when read, sparse outputs as a compressed CSR file.
+
+The cache file name contains a hash of the texts and a hash of the class and
+parameters of the encoder, so that editing the corpus or changing a parameter
+encodes the texts again. Encoders with a `random_state` parameter set to None
+give a different result at each fit and are never cached.
+"""
+
+import hashlib
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+import sklearn
+from scipy import sparse
+
+from .cache import CACHE_DIR, write_atomic
+
+
+def _hash_texts(texts):
+    digest = hashlib.sha256()
+    for text in texts:
+        encoded = str(text).encode()
+        # Prefix each text with its length so that the boundaries between
+        # texts are part of the hash
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()[:16]
+
+
+def _hash_encoder(encoder):
+    cls = type(encoder)
+    # The output of the encoder may change with the version of its library
+    package = sys.modules[cls.__module__.split(".")[0]]
+    package_version = getattr(package, "__version__", "")
+    params = repr(sorted(encoder.get_params(deep=True).items()))
+    key = (
+        f"{cls.__module__}.{cls.__qualname__}{params}"
+        f"{package_version}{sklearn.__version__}"
+    )
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def embedding_path(encoder, texts):
+    """Returns the path of the cached encoding of texts, without suffix."""
+    texts_hash, encoder_hash = _hash_texts(texts), _hash_encoder(encoder)
+    return CACHE_DIR / f"embedding-{texts_hash}-{encoder_hash}"
+
+
+def _is_deterministic(encoder):
+    params = encoder.get_params(deep=True)
+    return all(
+        value is not None
+        for name, value in params.items()
+        if name.split("__")[-1] == "random_state"
+    )
+
+
+def _as_float32(encoded):
+    # Dense outputs are stored as float32, cast them before writing so that
+    # the dtype does not depend on whether the cache could be written
+    if sparse.issparse(encoded):
+        return encoded
+    values = np.ascontiguousarray(encoded, dtype=np.float32)
+    if hasattr(encoded, "columns"):
+        return pd.DataFrame(values, columns=encoded.columns, copy=False)
+    return values
+
+
+def _write_cache(encoded, path):
+    if sparse.issparse(encoded):
+        write_atomic(
+            lambda f: sparse.save_npz(f, sparse.csr_matrix(encoded)),
+            path.with_suffix(".npz"),
+        )
+        return
+    if hasattr(encoded, "columns"):
+        columns = [str(col) for col in encoded.columns]
+        write_atomic(
+            lambda f: f.write(json.dumps(columns).encode()),
+            path.with_suffix(".json"),
+        )
+    values = np.ascontiguousarray(encoded, dtype=np.float32)
+    write_atomic(
+        lambda f: np.save(f, values, allow_pickle=False),
+        path.with_suffix(".npy"),
+    )
+
+
+def _read_cache(path):
+    if path.with_suffix(".npz").exists():
+        return sparse.load_npz(path.with_suffix(".npz"))
+    if not path.with_suffix(".npy").exists():
+        return None
+    values = np.load(path.with_suffix(".npy"), mmap_mode="r")
+    if path.with_suffix(".json").exists():
+        columns = json.loads(path.with_suffix(".json").read_text())
+        return pd.DataFrame(values, columns=columns, copy=False)
+    return values
+
+
+def encode_text(encoder, texts):
+    """Fits the encoder on texts, or reads the encoded texts from the cache.
+
+    Parameters
+    ----------
+    encoder : transformer
+        Unfitted text encoder, e.g. `skrub.StringEncoder` or
+        `sklearn.feature_extraction.text.TfidfVectorizer`. It is not fitted
+        when the encoded texts are read from the cache.
+    texts : Series or list of str
+        The corpus to encode.
+
+    Returns
+    -------
+    encoded : DataFrame, ndarray or sparse CSR matrix
+        The output of `encoder.fit_transform(texts)`. Dense outputs are
+        float32 and memory-mapped.
+    """
+    if not _is_deterministic(encoder):
+        return encoder.fit_transform(texts)
+
+    path = embedding_path(encoder, texts)
+    encoded = _read_cache(path)
+    if encoded is not None:
+        return encoded
+
+    encoded = _as_float32(encoder.fit_transform(texts))
+    try:
+        _write_cache(encoded, path)
+    except OSError:
+        # e.g. read-only file system, the cache is only an optimization
+        return encoded
+    return _read_cache(path)
@@ -0,0 +1,300 @@
+"""Registry of the CSV files of the datasets folder.
+
+Each file has one entry describing how to parse it: the dtypes of its
+columns, the levels of its categorical columns, its index and its target
+column. Importing the registry does not read any file. Datasets are parsed
+the first time they are loaded, through the columnar cache of
+`dataset_tools.cache`, and kept in memory so that each file is parsed at most
+once per process.
+"""
+
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Optional, Union
+
+import pandas as pd
+
+from .cache import DATA_DIR, read_csv
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Description of a CSV file of the datasets folder.
+
+    Columns missing from `dtypes` are inferred by pandas. A single dtype
+    applies to all the columns. Categorical columns are the keys of
+    `categories`, their values are the expected levels in order.
+    """
+
+    filename: str
+    dtypes: Union[dict, str] = field(default_factory=dict)
+    categories: dict = field(default_factory=dict)
+    target: Optional[str] = None
+    index: Optional[str] = None
+    parse_dates: list = field(default_factory=list)
+    na_values: Optional[str] = None
+
+    @property
+    def path(self):
+        return DATA_DIR / self.filename
+
+    def read_csv_kwargs(self):
+        """Returns the keyword arguments of `pandas.read_csv`.
+
+        Categorical columns are parsed as strings and converted afterwards so
+        that unexpected levels are reported instead of becoming missing
+        values.
+        """
+        if isinstance(self.dtypes, str):
+            dtype = self.dtypes
+        else:
+            dtype = {**self.dtypes, **{col: "str" for col in self.categories}}
+        kwargs = {"dtype": dtype}
+        if self.index is not None:
+            kwargs["index_col"] = self.index
+        if self.parse_dates:
+            kwargs["parse_dates"] = self.parse_dates
+        if self.na_values is not None:
+            kwargs["na_values"] = self.na_values
+        return kwargs
+
+
+ADULT_CENSUS_CLASSES = [" <=50K", " >50K"]
+ADULT_CENSUS_NUMERIC_DTYPES = {
+    "age": "int64",
+    "capital-gain": "int64",
+    "capital-loss": "int64",
+    "hours-per-week": "int64",
+}
+FINANCIAL_DATA_SYMBOLS = ["COP", "CVX", "TOT", "VLO", "XOM"]
+
+DATASETS = {
+    "adult-census": Dataset(
+        "adult-census.csv",
+        dtypes={
+            **ADULT_CENSUS_NUMERIC_DTYPES,
+            "education-num": "int64",
+            "workclass": "str",
+            "education": "str",
+            "marital-status": "str",
+            "occupation": "str",
+            "relationship": "str",
+            "race": "str",
+            "sex": "str",
+            "native-country": "str",
+        },
+        categories={"class": ADULT_CENSUS_CLASSES},
+        target="class",
+    ),
+    "adult-census-numeric": Dataset(
+        "adult-census-numeric.csv",
+        dtypes=ADULT_CENSUS_NUMERIC_DTYPES,
+        categories={"class": ADULT_CENSUS_CLASSES},
+        target="class",
+    ),
+    "adult-census-numeric-test": Dataset(
+        "adult-census-numeric-test.csv",
+        dtypes=ADULT_CENSUS_NUMERIC_DTYPES,
+        categories={"class": ADULT_CENSUS_CLASSES},
+        target="class",
+    ),
+    "adult-census-numeric-all": Dataset(
+        "adult-census-numeric-all.csv",
+        dtypes={**ADULT_CENSUS_NUMERIC_DTYPES, "education-num": "int64"},
+        categories={"class": ADULT_CENSUS_CLASSES},
+        target="class",
+    ),
+    "ames_housing_no_missing": Dataset(
+        "ames_housing_no_missing.csv",
+        dtypes={"SalePrice": "int64"},
+        target="SalePrice",
+    ),
+    "bbc_news": Dataset(
+        "bbc_news.csv",
+        dtypes={"text": "str"},
+        categories={
+            "category": [
+                "business",
+                "entertainment",
+                "politics",
+                "sport",
+                "tech",
+            ]
+        },
+        target="category",
+    ),
+    "bike_rides": Dataset(
+        "bike_rides.csv",
+        dtypes={
+            "power": "float64",
+            "heart-rate": "float64",
+            "cadence": "float64",
+            "speed": "float64",
+            "acceleration": "float64",
+            "slope": "float64",
+        },
+        target="power",
+        index="timestamp",
+        parse_dates=["timestamp"],
+    ),
+    "blood_transfusion": Dataset(
+        "blood_transfusion.csv",
+        dtypes={
+            "Recency": "int64",
+            "Frequency": "int64",
+            "Monetary": "int64",
+            "Time": "int64",
+        },
+        categories={"Class": ["donated", "not donated"]},
+        target="Class",
+    ),
+    "cps_85_wages": Dataset(
+        "cps_85_wages.csv",
+        dtypes={
+            "EDUCATION": "int64",
+            "EXPERIENCE": "int64",
+            "WAGE": "float64",
+            "AGE": "int64",
+        },
+        categories={
+            "SOUTH": ["no", "yes"],
+            "SEX": ["female", "male"],
+            "UNION": ["member", "not_member"],
+            "RACE": ["Hispanic", "Other", "White"],
+            "OCCUPATION": [
+                "Clerical",
+                "Management",
+                "Other",
+                "Professional",
+                "Sales",
+                "Service",
+            ],
+            "SECTOR": ["Construction", "Manufacturing", "Other"],
+            "MARR": ["Married", "Unmarried"],
+        },
+        target="WAGE",
+    ),
+    "house_prices": Dataset(
+        "house_prices.csv",
+        dtypes={"SalePrice": "int64"},
+        target="SalePrice",
+        index="Id",
+        na_values="?",
+    ),
+    "penguins": Dataset(
+        "penguins.csv",
+        dtypes={
+            "Sample Number": "int64",
+            "Individual ID": "str",
+            "Culmen Length (mm)": "float64",
+            "Culmen Depth (mm)": "float64",
+            "Flipper Length (mm)": "float64",
+            "Body Mass (g)": "float64",
+            "Delta 15 N (o/oo)": "float64",
+            "Delta 13 C (o/oo)": "float64",
+            "Comments": "str",
+        },
+        categories={
+            "studyName": ["PAL0708", "PAL0809", "PAL0910"],
+            "Species": [
+                "Adelie Penguin (Pygoscelis adeliae)",
+                "Chinstrap penguin (Pygoscelis antarctica)",
+                "Gentoo penguin (Pygoscelis papua)",
+            ],
+            "Region": ["Anvers"],
+            "Island": ["Biscoe", "Dream", "Torgersen"],
+            "Stage": ["Adult, 1 Egg Stage"],
+            "Clutch Completion": ["No", "Yes"],
+            # "." is used for one penguin whose sex could not be determined
+            "Sex": [".", "FEMALE", "MALE"],
+        },
+        target="Species",
+        parse_dates=["Date Egg"],
+    ),
+    "penguins_classification": Dataset(
+        "penguins_classification.csv",
+        dtypes={
+            "Culmen Length (mm)": "float64",
+            "Culmen Depth (mm)": "float64",
+        },
+        categories={"Species": ["Adelie", "Chinstrap", "Gentoo"]},
+        target="Species",
+    ),
+    "penguins_regression": Dataset(
+        "penguins_regression.csv",
+        dtypes={
+            "Flipper Length (mm)": "float64",
+            "Body Mass (g)": "float64",
+        },
+        target="Body Mass (g)",
+    ),
+    "periodic_signals": Dataset("periodic_signals.csv", dtypes="float64"),
+    "rfm_segmentation": Dataset(
+        "rfm_segmentation.csv",
+        dtypes={
+            "frequency": "int64",
+            "monetary": "float64",
+            "recency": "int64",
+        },
+    ),
+    **{
+        f"financial-data/{symbol}": Dataset(
+            f"financial-data/{symbol}.csv",
+            dtypes={"open": "float64", "close": "float64"},
+            index="date",
+            parse_dates=["date"],
+        )
+        for symbol in FINANCIAL_DATA_SYMBOLS
+    },
+}
+
+
+@cache
+def _load(name):
+    dataset = DATASETS[name]
+    df = read_csv(dataset.path, **dataset.read_csv_kwargs())
+    for col, levels in dataset.categories.items():
+        unexpected = set(df[col].dropna()) - set(levels)
+        if unexpected:
+            raise ValueError(
+                f"Unexpected values {sorted(unexpected)} in column {col!r} of"
+                f" {dataset.filename}, expected one of {levels}"
+            )
+        df[col] = df[col].astype(pd.CategoricalDtype(levels))
+    return df
+
+
+def load_dataset(name, return_X_y=False):
+    """Loads a dataset of the registry.
+
+    Parameters
+    ----------
+    name : str
+        Name of the dataset, i.e. the path of the CSV file relative to the
+        datasets folder without the extension, e.g. "penguins_regression" or
+        "financial-data/XOM".
+    return_X_y : bool, default=False
+        If True, returns the data and the target separately.
+
+    Returns
+    -------
+    df : DataFrame
+        Returned when `return_X_y` is False.
+    (data, target) : tuple of DataFrame and Series
+        Returned when `return_X_y` is True.
+    """
+    if name not in DATASETS:
+        raise ValueError(
+            f"Unknown dataset {name!r}, available datasets are:"
+            f" {sorted(DATASETS)}"
+        )
+    # The parsed dataframe is shared between calls, return a copy so that
+    # modifying it in a notebook does not affect the next calls
+    df = _load(name).copy()
+    if not return_X_y:
+        return df
+
+    target_name = DATASETS[name].target
+    if target_name is None:
+        raise ValueError(f"Dataset {name!r} does not have a target column")
+    return df.drop(columns=target_name), df[target_name]
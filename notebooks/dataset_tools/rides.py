@@ -0,0 +1,224 @@
+"""Chunked reading of bike ride logs.
+
+`bike_rides.csv` holds one record per second of a few rides of a cyclist. It
+fits in memory, but logs of many more rides do not. The functions of this
+module read a ride log in chunks of `chunksize` rows and only keep what a
+chunk needs from the previous ones, so that their memory does not grow with
+the length of the log:
+
+- `iter_ride_chunks` yields the chunks with a `ride` column numbering the
+  rides. The records must be sorted by time, a new ride starts after a gap of
+  more than `max_gap` between two records;
+- `ride_summary` returns one row per ride: its first and last timestamps, its
+  first row and number of rows in the file, and the mean, min and max of each
+  measurement. `ride_groups` expands it into the ride of each row, e.g. the
+  `groups` of a `LeaveOneGroupOut` cross-validation;
+- `resample_rides` returns the mean of each measurement per time bin of each
+  ride;
+- `iter_rolling_features` yields the mean of each measurement over a sliding
+  time window, within each ride, chunk by chunk.
+
+The results are the ones computed on the whole dataframe with pandas.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .registry import DATASETS
+
+DEFAULT_CHUNKSIZE = 50_000
+DEFAULT_MAX_GAP = "1h"
+
+
+def iter_ride_chunks(
+    filepath=None, chunksize=DEFAULT_CHUNKSIZE, max_gap=DEFAULT_MAX_GAP
+):
+    """Reads a ride log in chunks and numbers its rides.
+
+    Parameters
+    ----------
+    filepath : str or Path, default=None
+        A CSV file with the columns of `bike_rides.csv`, sorted by time. The
+        `bike_rides.csv` file of the datasets folder if None.
+    chunksize : int, default=50_000
+        Number of rows of each chunk.
+    max_gap : str or Timedelta, default="1h"
+        Longest gap between two records of the same ride.
+
+    Yields
+    ------
+    chunk : DataFrame
+        The rows of the chunk, indexed by timestamp, with an extra `ride`
+        column numbering the rides from 0.
+    """
+    dataset = DATASETS["bike_rides"]
+    filepath = dataset.path if filepath is None else filepath
+    max_gap = pd.Timedelta(max_gap)
+
+    ride, last_timestamp = -1, None
+    with pd.read_csv(
+        filepath, chunksize=chunksize, **dataset.read_csv_kwargs()
+    ) as reader:
+        for chunk in reader:
+            timestamps = chunk.index.to_series()
+            gaps = timestamps.diff()
+            if last_timestamp is not None:
+                gaps.iloc[0] = timestamps.iloc[0] - last_timestamp
+            # The gap of the first record of the log is NaT
+            new_ride = (gaps > max_gap) | gaps.isna()
+            chunk["ride"] = ride + new_ride.cumsum().to_numpy()
+            ride, last_timestamp = chunk["ride"].iloc[-1], timestamps.iloc[-1]
+            yield chunk
+
+
+def ride_summary(
+    filepath=None, chunksize=DEFAULT_CHUNKSIZE, max_gap=DEFAULT_MAX_GAP
+):
+    """Returns one row per ride of a ride log, read in chunks.
+
+    Parameters
+    ----------
+    filepath, chunksize, max_gap
+        See `iter_ride_chunks`.
+
+    Returns
+    -------
+    summary : DataFrame
+        Indexed by ride, with the `start` and `end` timestamps of each ride,
+        its `first_row` and `n_samples` rows in the file, and the
+        `<measurement>_mean`, `<measurement>_min` and `<measurement>_max` of
+        each measurement.
+    """
+    partial_summaries = []
+    offset = 0
+    for chunk in iter_ride_chunks(filepath, chunksize, max_gap):
+        measurements = chunk.drop(columns="ride")
+        rides = chunk["ride"].to_numpy()
+        partial = measurements.groupby(rides).agg(
+            ["sum", "count", "min", "max"]
+        )
+        partial.columns = [f"{col}_{stat}" for col, stat in partial.columns]
+        timestamps = chunk.index.to_series(index=rides)
+        partial["start"] = timestamps.groupby(level=0).min()
+        partial["end"] = timestamps.groupby(level=0).max()
+        positions = pd.Series(offset + np.arange(len(chunk)), index=rides)
+        partial["first_row"] = positions.groupby(level=0).min()
+        partial["n_samples"] = positions.groupby(level=0).size()
+        partial_summaries.append(partial)
+        offset += len(chunk)
+
+    # A ride spread over several chunks has one partial summary per chunk
+    partial = pd.concat(partial_summaries).groupby(level=0)
+    summary = pd.DataFrame(
+        {
+            "start": partial["start"].min(),
+            "end": partial["end"].max(),
+            "first_row": partial["first_row"].min(),
+            "n_samples": partial["n_samples"].sum(),
+        }
+    )
+    for col in measurements.columns:
+        summary[f"{col}_mean"] = (
+            partial[f"{col}_sum"].sum() / partial[f"{col}_count"].sum()
+        )
+        summary[f"{col}_min"] = partial[f"{col}_min"].min()
+        summary[f"{col}_max"] = partial[f"{col}_max"].max()
+    summary.index.name = "ride"
+    return summary
+
+
+def ride_groups(summary):
+    """Returns the ride of each row of the log of a `ride_summary`."""
+    return np.repeat(summary.index.to_numpy(), summary["n_samples"])
+
+
+def resample_rides(
+    rule="60s",
+    filepath=None,
+    chunksize=DEFAULT_CHUNKSIZE,
+    max_gap=DEFAULT_MAX_GAP,
+):
+    """Returns the mean of each measurement per time bin of each ride.
+
+    Parameters
+    ----------
+    rule : str, default="60s"
+        The length of the time bins, as in `DataFrame.resample`.
+    filepath, chunksize, max_gap
+        See `iter_ride_chunks`.
+
+    Returns
+    -------
+    resampled : DataFrame
+        Indexed by ride and start of the time bin. For a ride,
+        `resampled.loc[ride]` is `ride_data.resample(rule).mean()`.
+    """
+    sums, counts = [], []
+    for chunk in iter_ride_chunks(filepath, chunksize, max_gap):
+        # The bins start at the same times in all the chunks
+        measurements = list(chunk.columns.drop("ride"))
+        grouped = chunk.groupby("ride")[measurements].resample(
+            rule, origin="epoch"
+        )
+        sums.append(grouped.sum())
+        counts.append(grouped.count())
+
+    # A bin spread over two chunks has a partial sum in each chunk
+    total = pd.concat(sums).groupby(level=[0, 1]).sum()
+    count = pd.concat(counts).groupby(level=[0, 1]).sum()
+    return total / count.where(count > 0)
+
+
+def iter_rolling_features(
+    window="60s",
+    columns=None,
+    filepath=None,
+    chunksize=DEFAULT_CHUNKSIZE,
+    max_gap=DEFAULT_MAX_GAP,
+):
+    """Yields the mean of the measurements over a sliding window, by chunk.
+
+    The mean at a record is the mean of the records of the same ride in the
+    `window` ending at it, as computed by
+    `ride_data.rolling(window).mean()`. Only the records of the previous
+    chunk that are in the window of the first record of a chunk are kept
+    between chunks.
+
+    Parameters
+    ----------
+    window : str or Timedelta, default="60s"
+        The length of the window.
+    columns : list of str, default=None
+        The measurements to average, all of them if None.
+    filepath, chunksize, max_gap
+        See `iter_ride_chunks`.
+
+    Yields
+    ------
+    features : DataFrame
+        The rolling means of the rows of the chunk, with a `ride` column.
+    """
+    window = pd.Timedelta(window)
+    carried = None
+    for chunk in iter_ride_chunks(filepath, chunksize, max_gap):
+        if columns is None:
+            columns = list(chunk.columns.drop("ride"))
+        frame = chunk[columns + ["ride"]]
+        n_carried = 0
+        if carried is not None:
+            n_carried = len(carried)
+            frame = pd.concat([carried, frame])
+
+        # The rides are consecutive: grouping them keeps the order of the
+        # rows
+        features = (
+            frame.groupby("ride", sort=False)[columns]
+            .rolling(window)
+            .mean()
+            .reset_index(level=0)
+        )
+        yield features.iloc[n_carried:]
+
+        last_timestamp, last_ride = frame.index[-1], frame["ride"].iloc[-1]
+        in_window = frame.index > last_timestamp - window
+        carried = frame[in_window & (frame["ride"] == last_ride)]
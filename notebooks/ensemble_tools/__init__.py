@@ -0,0 +1,5 @@
+"""Helpers shared by the ensemble lessons."""
+
+from .trace import BoostingTrace, trace_adaboost, trace_residual_boosting
+
+__all__ = ["BoostingTrace", "trace_adaboost", "trace_residual_boosting"]
@@ -0,0 +1,90 @@
+"""Error of a linear model with one feature for many pairs of parameters.
+
+The linear model `y = weight * x + intercept` has two parameters. Its mean
+squared error on a dataset, as a function of the two parameters, is a surface
+that can be drawn e.g. with a contour plot. `mean_squared_error_grid`
+evaluates it on a grid of weights and intercepts without a Python loop: the
+predictions of all the pairs of parameters for all the samples are computed
+by broadcasting, in chunks of weights so that the temporary array holds at
+most `max_n_values` values.
+
+`least_squares_fit` returns the parameters with the lowest error, computed
+with the closed-form solution of ordinary least squares.
+"""
+
+import numpy as np
+
+MAX_N_VALUES = 2_000_000
+
+
+def mean_squared_error_grid(x, y, weights, intercepts, max_n_values=None):
+    """Mean squared error of `weight * x + intercept` for each pair of
+    parameters of a grid.
+
+    Parameters
+    ----------
+    x : array-like of shape (n_samples,)
+        The feature.
+    y : array-like of shape (n_samples,)
+        The target.
+    weights : array-like of shape (n_weights,)
+        The weights of the grid.
+    intercepts : array-like of shape (n_intercepts,)
+        The intercepts of the grid.
+    max_n_values : int, default=None
+        Maximum number of values of the temporary array of predictions,
+        2 million (16 MB) if None.
+
+    Returns
+    -------
+    errors : ndarray of shape (n_intercepts, n_weights)
+        The mean squared error of each pair of parameters. Its shape is the
+        one of `np.meshgrid(weights, intercepts)`, so that it can be drawn
+        with `plt.contour(weights, intercepts, errors)`.
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    weights = np.asarray(weights, dtype=np.float64)
+    intercepts = np.asarray(intercepts, dtype=np.float64)
+    if max_n_values is None:
+        max_n_values = MAX_N_VALUES
+
+    # The residuals of a pair of parameters are `(y - weight * x) - intercept`:
+    # the first term is computed once per weight, then broadcast against all
+    # the intercepts
+    chunk_size = max(max_n_values // (len(x) * len(intercepts)), 1)
+    errors = np.empty((len(intercepts), len(weights)))
+    for start in range(0, len(weights), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        # shape (n_weights_chunk, n_samples)
+        partial_residuals = y - weights[chunk, np.newaxis] * x
+        # shape (n_weights_chunk, n_intercepts, n_samples)
+        residuals = (
+            partial_residuals[:, np.newaxis, :]
+            - intercepts[np.newaxis, :, np.newaxis]
+        )
+        errors[:, chunk] = np.mean(residuals**2, axis=2).T
+    return errors
+
+
+def least_squares_fit(x, y):
+    """Returns the weight and intercept with the lowest mean squared error.
+
+    Parameters
+    ----------
+    x : array-like of shape (n_samples,)
+        The feature.
+    y : array-like of shape (n_samples,)
+        The target.
+
+    Returns
+    -------
+    weight, intercept : float
+        The parameters of the ordinary least squares fit.
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    x_centered, y_centered = x - x.mean(), y - y.mean()
+    weight = np.dot(x_centered, y_centered) / np.dot(x_centered, x_centered)
+    intercept = y.mean() - weight * x.mean()
+    return weight, intercept
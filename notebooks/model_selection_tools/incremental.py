@@ -0,0 +1,198 @@
+"""Validation curves over the number of estimators of an ensemble.
+
+`ValidationCurveDisplay.from_estimator(model, ..., param_name="n_estimators")`
+fits a whole ensemble from scratch for each value of `param_range`, although
+the ensemble with `n` trees is the beginning of the ensemble with more trees.
+
+`incremental_validation_curve` fits the ensemble once per fold and scores it
+at each size on the way:
+
+- boosting models, which have `staged_predict`, are fitted with the largest
+  value of `param_range` and their predictions after each stage are read with
+  `staged_predict`, `staged_predict_proba` or `staged_decision_function`;
+- forests and bagging models are grown with `warm_start=True`, adding the
+  missing trees at each value of `param_range`.
+
+With a fixed `random_state`, the scores are the ones of the models fitted from
+scratch.
+"""
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import check_cv
+from sklearn.utils import _safe_indexing
+
+_STAGED_METHODS = {
+    "predict": "staged_predict",
+    "predict_proba": "staged_predict_proba",
+    "decision_function": "staged_decision_function",
+}
+
+
+class _StagedResponses:
+    """Responses of a fitted boosting model on `X` after each of `stages`.
+
+    The responses of a method are computed on first use, in a single pass of
+    its staged version.
+    """
+
+    def __init__(self, estimator, X, stages):
+        self.estimator = estimator
+        self.X = X
+        self.stages = stages
+        self._responses = {}
+
+    def get(self, method, stage):
+        if method not in self._responses:
+            staged = getattr(self.estimator, _STAGED_METHODS[method])(self.X)
+            stages = set(self.stages)
+            self._responses[method] = {
+                n_stages: response
+                for n_stages, response in enumerate(staged, start=1)
+                if n_stages in stages
+            }
+        return self._responses[method][stage]
+
+
+class _Stage:
+    """Fitted boosting model truncated to its first `stage` stages, only
+    able to predict the data of its `_StagedResponses`.
+    """
+
+    def __init__(self, responses, stage):
+        self._responses = responses
+        self._stage = stage
+
+    def __getattr__(self, name):
+        # Scorers also read e.g. `classes_` and the tags of the model
+        return getattr(self._responses.estimator, name)
+
+    def predict(self, X):
+        return self._responses.get("predict", self._stage)
+
+    def predict_proba(self, X):
+        return self._responses.get("predict_proba", self._stage)
+
+    def decision_function(self, X):
+        return self._responses.get("decision_function", self._stage)
+
+
+def _staged_scores(estimator, X, y, train, test, param_name, stages, scorer):
+    X_train, y_train = _safe_indexing(X, train), _safe_indexing(y, train)
+    X_test, y_test = _safe_indexing(X, test), _safe_indexing(y, test)
+    estimator = clone(estimator).set_params(**{param_name: stages[-1]})
+    estimator.fit(X_train, y_train)
+
+    train_responses = _StagedResponses(estimator, X_train, stages)
+    test_responses = _StagedResponses(estimator, X_test, stages)
+    train_scores, test_scores = [], []
+    for stage in stages:
+        train_scores.append(
+            scorer(_Stage(train_responses, stage), X_train, y_train)
+        )
+        test_scores.append(
+            scorer(_Stage(test_responses, stage), X_test, y_test)
+        )
+    return train_scores, test_scores
+
+
+def _warm_start_scores(
+    estimator, X, y, train, test, param_name, stages, scorer
+):
+    X_train, y_train = _safe_indexing(X, train), _safe_indexing(y, train)
+    X_test, y_test = _safe_indexing(X, test), _safe_indexing(y, test)
+    estimator = clone(estimator).set_params(warm_start=True)
+
+    train_scores, test_scores = [], []
+    for stage in stages:
+        # Only the trees missing to reach `stage` trees are fitted
+        estimator.set_params(**{param_name: stage})
+        estimator.fit(X_train, y_train)
+        train_scores.append(scorer(estimator, X_train, y_train))
+        test_scores.append(scorer(estimator, X_test, y_test))
+    return train_scores, test_scores
+
+
+def incremental_validation_curve(
+    estimator,
+    X,
+    y,
+    param_range,
+    param_name="n_estimators",
+    cv=None,
+    scoring=None,
+    n_jobs=None,
+):
+    """Validation curve over the number of estimators of an ensemble, with a
+    single fit of the ensemble per fold.
+
+    The scores are the ones of `sklearn.model_selection.validation_curve`, so
+    that they can be plotted with `ValidationCurveDisplay`::
+
+        train_scores, test_scores = incremental_validation_curve(
+            forest, X, y, param_range
+        )
+        display = ValidationCurveDisplay(
+            param_name="n_estimators",
+            param_range=param_range,
+            train_scores=train_scores,
+            test_scores=test_scores,
+        )
+        display.plot()
+
+    Parameters
+    ----------
+    estimator : estimator
+        An ensemble with a `staged_predict` method, e.g. a gradient boosting
+        model, or a `warm_start` parameter, e.g. a random forest.
+    X : array-like of shape (n_samples, n_features)
+        The data.
+    y : array-like of shape (n_samples,)
+        The target.
+    param_range : array-like of int
+        The numbers of estimators at which the ensemble is scored.
+    param_name : str, default="n_estimators"
+        Name of the parameter setting the number of estimators, e.g.
+        "max_iter" for `HistGradientBoostingRegressor`.
+    cv : int, cross-validation generator or iterable, default=None
+        Cross-validation strategy, as in `validation_curve`.
+    scoring : str or callable, default=None
+        Scoring of the models, see `sklearn.metrics.check_scoring`.
+    n_jobs : int, default=None
+        Number of folds fitted in parallel.
+
+    Returns
+    -------
+    train_scores : ndarray of shape (n_ticks, n_cv_folds)
+        Scores on the training sets.
+    test_scores : ndarray of shape (n_ticks, n_cv_folds)
+        Scores on the test sets.
+    """
+    if hasattr(estimator, "staged_predict"):
+        scores_func = _staged_scores
+    elif "warm_start" in estimator.get_params():
+        scores_func = _warm_start_scores
+    else:
+        raise ValueError(
+            f"{estimator.__class__.__name__} has neither a staged_predict "
+            "method nor a warm_start parameter"
+        )
+
+    param_range = np.asarray(param_range)
+    # The ensemble is grown once, through the sorted numbers of estimators
+    stages, positions = np.unique(param_range, return_inverse=True)
+    stages = [int(stage) for stage in stages]
+    cv = check_cv(cv, y, classifier=is_classifier(estimator))
+    scorer = check_scoring(estimator, scoring)
+
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(scores_func)(
+            estimator, X, y, train, test, param_name, stages, scorer
+        )
+        for train, test in cv.split(X, y)
+    )
+    train_scores = np.array([train for train, _ in results]).T
+    test_scores = np.array([test for _, test in results]).T
+    return train_scores[positions], test_scores[positions]
@@ -0,0 +1,142 @@
+"""Repeated nested cross-validation of a grid search.
+
+Repeating `cross_val_score(GridSearchCV(...), cv=outer_cv)` for several
+random states runs one trial after the other, each with a process pool for
+the outer folds and another one for the grid search of each fold. The pools
+are nested, so they either oversubscribe the CPUs or leave most of them idle
+while the last folds of a trial finish.
+
+`repeated_nested_cross_validation` flattens all the fits of all the trials,
+i.e. the `(trial, outer fold, inner fold, parameters)` tasks of the nested
+searches and the `(trial, inner fold, parameters)` tasks of the non-nested
+searches, into a single list of tasks run on one joblib pool. Once all the
+inner scores are known, the best model of each outer fold is refitted and
+scored on the same pool.
+"""
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import KFold, ParameterGrid
+
+
+def _fit_and_score(estimator, params, X, y, train, test, scoring):
+    estimator = clone(estimator).set_params(**params)
+    estimator.fit(X[train], y[train])
+    return check_scoring(estimator, scoring)(estimator, X[test], y[test])
+
+
+def repeated_nested_cross_validation(
+    estimator,
+    param_grid,
+    X,
+    y,
+    random_states=range(20),
+    inner_n_splits=5,
+    outer_n_splits=3,
+    scoring=None,
+    n_jobs=None,
+):
+    """Compares non-nested and nested cross-validation of a grid search.
+
+    For each random state `i`, the inner and outer cross-validations are
+    `KFold(n_splits, shuffle=True, random_state=i)`. The scores are the ones
+    of the following code, with all the fits run as a single grid of tasks::
+
+        search = GridSearchCV(estimator, param_grid, cv=inner_cv)
+        not_nested = search.fit(X, y).best_score_
+        nested = cross_val_score(search, X, y, cv=outer_cv).mean()
+
+    Parameters
+    ----------
+    estimator : estimator
+        The model to tune.
+    param_grid : dict or list of dict
+        The grid of parameters, as in `GridSearchCV`.
+    X : array-like of shape (n_samples, n_features)
+        The data.
+    y : array-like of shape (n_samples,)
+        The target.
+    random_states : iterable of int, default=range(20)
+        One trial is run for each random state.
+    inner_n_splits : int, default=5
+        Number of folds of the cross-validation of the grid search.
+    outer_n_splits : int, default=3
+        Number of folds of the cross-validation of the tuned model.
+    scoring : str or callable, default=None
+        Scoring of the models, see `sklearn.metrics.check_scoring`.
+    n_jobs : int, default=None
+        Number of workers of the pool running all the fits.
+
+    Returns
+    -------
+    not_nested_scores : ndarray of shape (n_trials,)
+        Best mean inner cross-validation score of each trial.
+    nested_scores : ndarray of shape (n_trials,)
+        Mean outer cross-validation score of each trial.
+    """
+    X, y = np.asarray(X), np.asarray(y)
+    candidates = list(ParameterGrid(param_grid))
+    random_states = list(random_states)
+    indices = np.arange(X.shape[0])
+
+    # A search is a grid search on a subset of the data: either the whole data
+    # (not nested) or the training set of an outer fold (nested)
+    searches = []
+    for random_state in random_states:
+        inner_cv = KFold(
+            inner_n_splits, shuffle=True, random_state=random_state
+        )
+        outer_cv = KFold(
+            outer_n_splits, shuffle=True, random_state=random_state
+        )
+        subsets = [(indices, None)] + list(outer_cv.split(X))
+        for train, test in subsets:
+            inner_splits = [
+                (train[inner_train], train[inner_test])
+                for inner_train, inner_test in inner_cv.split(train)
+            ]
+            searches.append((train, test, inner_splits))
+
+    with Parallel(n_jobs=n_jobs) as parallel:
+        inner_scores = parallel(
+            delayed(_fit_and_score)(
+                estimator, params, X, y, train, test, scoring
+            )
+            for _, _, inner_splits in searches
+            for params in candidates
+            for train, test in inner_splits
+        )
+        # Mean inner score of each candidate of each search. As in
+        # GridSearchCV, ties are broken by the order of the candidates
+        mean_scores = (
+            np.asarray(inner_scores)
+            .reshape(len(searches), len(candidates), inner_n_splits)
+            .mean(axis=2)
+        )
+        best_scores = mean_scores.max(axis=1)
+        best_candidates = mean_scores.argmax(axis=1)
+
+        nested_searches = [
+            (search, best_candidate)
+            for search, best_candidate in zip(searches, best_candidates)
+            if search[1] is not None
+        ]
+        outer_scores = parallel(
+            delayed(_fit_and_score)(
+                estimator,
+                candidates[best_candidate],
+                X,
+                y,
+                train,
+                test,
+                scoring,
+            )
+            for (train, test, _), best_candidate in nested_searches
+        )
+
+    n_trials = len(random_states)
+    best_scores = best_scores.reshape(n_trials, outer_n_splits + 1)
+    outer_scores = np.asarray(outer_scores).reshape(n_trials, outer_n_splits)
+    return best_scores[:, 0], outer_scores.mean(axis=1)
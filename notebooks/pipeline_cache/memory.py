@@ -0,0 +1,113 @@
+"""Cache of the fitted preprocessing steps of the pipelines of the course.
+
+When a pipeline is tuned, every candidate and fold fits the preprocessing
+steps again, although only the parameters of the last step change. With
+`Pipeline(memory=...)`, scikit-learn stores the fitted transformers and the
+transformed data in a `joblib.Memory` and reuses them when the same steps are
+fitted on the same data.
+
+All the pipelines created with `memory=get_memory()` share a folder, so that
+notebooks executed again, or searches on the same data, reuse the steps
+fitted before. The folder is
+`SKLEARN_MOOC_PIPELINE_CACHE` if this environment variable is set, or a
+folder of the temporary directory otherwise. Its size is bounded: once it is
+larger than `bytes_limit`, the least recently used steps are removed.
+
+The calls to the cache are counted in files of the cache folder, so that the
+calls made in the joblib workers of a parameter search are counted too.
+`cache_info` returns the number of hits and misses.
+"""
+
+import functools
+import os
+import shutil
+import tempfile
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+from joblib import Memory
+
+CACHE_ENV_VAR = "SKLEARN_MOOC_PIPELINE_CACHE"
+DEFAULT_BYTES_LIMIT = "500M"
+STATS_DIRNAME = ".stats"
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "hit_rate", "size_mb"])
+
+
+def cache_location():
+    location = os.environ.get(CACHE_ENV_VAR)
+    if location:
+        return Path(location)
+    return Path(tempfile.gettempdir()) / "sklearn-mooc-pipeline-cache"
+
+
+class PipelineMemory(Memory):
+    """`joblib.Memory` counting the hits and misses of its cached functions
+    and removing the least recently used items above `bytes_limit`.
+    """
+
+    def __init__(self, location, bytes_limit=DEFAULT_BYTES_LIMIT):
+        super().__init__(location, verbose=0)
+        self.bytes_limit = bytes_limit
+
+    def _count(self, name):
+        # Appending a byte is atomic, so that concurrent workers can count
+        # in the same file
+        stats_dir = Path(self.location) / STATS_DIRNAME
+        stats_dir.mkdir(parents=True, exist_ok=True)
+        with open(stats_dir / name, "ab") as f:
+            f.write(b".")
+
+    def cache(self, func=None, **kwargs):
+        if func is None:
+            return functools.partial(self.cache, **kwargs)
+        state = threading.local()
+
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            state.missed = True
+            return func(*args, **kwargs)
+
+        cached_compute = super().cache(compute, **kwargs)
+
+        @functools.wraps(func)
+        def counted(*args, **kwargs):
+            state.missed = False
+            result = cached_compute(*args, **kwargs)
+            if state.missed:
+                self._count("misses")
+                self.reduce_size(bytes_limit=self.bytes_limit)
+            else:
+                self._count("hits")
+            return result
+
+        return counted
+
+
+def get_memory(bytes_limit=DEFAULT_BYTES_LIMIT):
+    """Returns the memory shared by the pipelines of the course."""
+    return PipelineMemory(cache_location(), bytes_limit=bytes_limit)
+
+
+def cache_info():
+    """Returns the hits, misses, hit rate and size in MB of the cache."""
+    location = cache_location()
+    stats_dir = location / STATS_DIRNAME
+    counts = {}
+    for name in ["hits", "misses"]:
+        path = stats_dir / name
+        counts[name] = path.stat().st_size if path.exists() else 0
+    n_calls = counts["hits"] + counts["misses"]
+    hit_rate = counts["hits"] / n_calls if n_calls else 0.0
+    size = sum(
+        path.stat().st_size
+        for path in location.rglob("*")
+        if path.is_file() and stats_dir not in path.parents
+    )
+    return CacheInfo(counts["hits"], counts["misses"], hit_rate, size / 1e6)
+
+
+def clear_cache():
+    """Removes the cached steps and resets the counts of the cache."""
+    shutil.rmtree(cache_location(), ignore_errors=True)
@@ -0,0 +1,5 @@
+"""Helpers drawing the figures of the lessons."""
+
+from .boundary import decision_boundary_response, draw_decision_boundary
+
+__all__ = ["decision_boundary_response", "draw_decision_boundary"]
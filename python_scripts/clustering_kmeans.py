@@ -286,7 +286,8 @@ _ = plt.title("Elbow method using WCSS")
 # the preprocessed features:
 
 # %%
-from sklearn.metrics import silhouette_score
+from clustering_tools import n_clusters_sweep
+from compute_config import N_JOBS
 
 
 def plot_silhouette_scores(
@@ -304,12 +305,16 @@ def plot_silhouette_scores(
 
     preprocessed_data = preprocessor.fit_transform(data)
 
-    silhouette_scores = []
-    for n_clusters in n_clusters_values:
-        clustering_model.set_params(n_clusters=n_clusters)
-        cluster_labels = clustering_model.fit_predict(preprocessed_data)
-        score = silhouette_score(preprocessed_data, cluster_labels)
-        silhouette_scores.append(score)
+    # Fit one model per value of n_clusters in parallel and compute the
+    # silhouette scores of all their labels from a single pass over the
+    # pairwise distances
+    scores = n_clusters_sweep(
+        clustering_model,
+        preprocessed_data,
+        n_clusters_values=n_clusters_values,
+        n_jobs=N_JOBS,
+    )
+    silhouette_scores = scores["silhouette"]
 
     plt.plot(n_clusters_values, silhouette_scores, marker="o")
     plt.xlabel("Number of clusters (n_clusters)")
@@ -138,9 +138,15 @@ pd.Series(cluster_labels).value_counts()
 import matplotlib.pyplot as plt
 from sklearn.model_selection import ValidationCurveDisplay
 from sklearn.model_selection import ShuffleSplit
+from dataset_tools import encode_text
 
 cv = ShuffleSplit(n_splits=5, train_size=0.75, random_state=0)
-data_encoded = StringEncoder().fit_transform(data["text"])
+# Encoding the whole corpus takes a few seconds, much longer than fitting
+# k-means on it. The `encode_text` helper of this course stores the encoded
+# documents on disk and reads them back when re-executing this notebook. The
+# `random_state` of the encoder is fixed so that it always computes the same
+# encoding.
+data_encoded = encode_text(StringEncoder(random_state=0), data["text"])
 n_clusters_values = range(2, 11)
 scoring_names = {
     "V-measure": "v_measure_score",
@@ -189,30 +195,34 @@ _ = plt.suptitle(
 # But the question may arise, if we didn't have access to labels at all, would
 # the silhouette score also lead us to chose `n_clusters=5`?
 
+# %% [markdown]
+# Here we use `n_clusters_sweep` from the `clustering_tools` module of this
+# course: it fits k-means for every pair of resampling and `n_clusters` in
+# parallel and computes the silhouette scores of all the values of `n_clusters`
+# of a given resampling together, so that the pairwise distances between the
+# documents of the validation set are only computed once.
+
 # %%
-import numpy as np
-from sklearn.metrics import silhouette_score
-from sklearn.model_selection import train_test_split
+from clustering_tools import n_clusters_sweep
+from compute_config import N_JOBS
 
 n_clusters_values = list(range(2, 11)) + [20, 30, 40, 50, 60, 70]
-all_scores = []
-for random_state in range(1, 11):
-    data_train, data_test = train_test_split(
-        data_encoded, train_size=0.5, random_state=random_state
-    )
-    scores = []
-    for n_clusters in n_clusters_values:
-        model = KMeans(n_clusters=n_clusters, n_init=5, random_state=0)
-        cluster_labels = model.fit(data_train).predict(data_test)
-        score = silhouette_score(data_test, cluster_labels)
-        scores.append(score)
-
-    all_scores.append(scores)
+results = n_clusters_sweep(
+    KMeans(n_init=5, random_state=0),
+    data_encoded,
+    n_clusters_values,
+    resampling_random_states=range(1, 11),
+    eval_set="test",
+    n_jobs=N_JOBS,
+)
+all_scores = results.pivot(
+    index="resample", columns="n_clusters", values="silhouette"
+)
+for _, scores in all_scores.iterrows():
     plt.plot(n_clusters_values, scores, color="tab:blue", alpha=0.2)
-    plt.xlabel("Number of clusters (n_clusters)")
-    plt.ylabel("Silhouette score")
+plt.xlabel("Number of clusters (n_clusters)")
+plt.ylabel("Silhouette score")
 
-all_scores = np.array(all_scores)
 plt.plot(
     n_clusters_values,
     all_scores.mean(axis=0),
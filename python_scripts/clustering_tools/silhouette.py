@@ -0,0 +1,103 @@
+"""Silhouette scores of several labelings of the same data.
+
+`sklearn.metrics.silhouette_score` computes the pairwise distances between
+all the samples each time it is called. When comparing labelings of the same
+data, e.g. for a range of `n_clusters`, the distances are the same for all
+of them. `silhouette_scores` computes them once, by chunks of rows whose size
+is bounded by `working_memory`, and scores all the labelings with each
+chunk.
+"""
+
+import numpy as np
+from scipy import sparse
+from sklearn.metrics import pairwise_distances_chunked
+
+
+def _encode(labels):
+    """Returns the cluster index of each sample, the cluster sizes and a
+    sparse (n_samples, n_clusters) indicator matrix.
+    """
+    _, codes, counts = np.unique(
+        labels, return_inverse=True, return_counts=True
+    )
+    n_samples = codes.shape[0]
+    indicator = sparse.csr_matrix(
+        (np.ones(n_samples), (np.arange(n_samples), codes)),
+        shape=(n_samples, counts.shape[0]),
+    )
+    return codes, counts, indicator
+
+
+def silhouette_scores(
+    X, labelings, metric="euclidean", working_memory=None, **kwds
+):
+    """Computes the mean silhouette coefficient of several labelings of X.
+
+    Parameters
+    ----------
+    X : array-like or sparse matrix of shape (n_samples, n_features)
+        The data.
+    labelings : list of array-like of shape (n_samples,)
+        Cluster labels. Each labeling must have between 2 and n_samples - 1
+        distinct labels.
+    metric : str or callable, default="euclidean"
+        Metric used to compute the distances, see
+        `sklearn.metrics.pairwise_distances`.
+    working_memory : int, default=None
+        Maximum memory in MiB used by a chunk of the distance matrix. If None,
+        the scikit-learn `working_memory` setting is used.
+    **kwds
+        Passed to the distance function.
+
+    Returns
+    -------
+    scores : ndarray of shape (n_labelings,)
+        Mean silhouette coefficient of each labeling, as returned by
+        `sklearn.metrics.silhouette_score`.
+    """
+    encoded = [_encode(labels) for labels in labelings]
+    for codes, counts, _ in encoded:
+        if not 2 <= counts.shape[0] <= codes.shape[0] - 1:
+            raise ValueError(
+                f"Number of labels is {counts.shape[0]}. Valid values are 2"
+                " to n_samples - 1 (inclusive)"
+            )
+
+    def reduce_func(D_chunk, start):
+        # Sum of the distances of each sample of the chunk to the samples of
+        # each cluster, for each labeling
+        return tuple(
+            np.asarray(D_chunk @ indicator) for _, _, indicator in encoded
+        )
+
+    chunks = list(
+        pairwise_distances_chunked(
+            X,
+            reduce_func=reduce_func,
+            metric=metric,
+            working_memory=working_memory,
+            **kwds,
+        )
+    )
+
+    scores = []
+    for labeling_idx, (codes, counts, _) in enumerate(encoded):
+        cluster_distances = np.concatenate(
+            [chunk[labeling_idx] for chunk in chunks]
+        )
+        samples = np.arange(codes.shape[0])
+        # Mean distance to the other samples of the same cluster
+        own_counts = counts[codes]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            intra = cluster_distances[samples, codes] / (own_counts - 1)
+        # Mean distance to the samples of the nearest other cluster
+        cluster_distances /= counts
+        cluster_distances[samples, codes] = np.inf
+        inter = cluster_distances.min(axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            silhouette = (inter - intra) / np.maximum(intra, inter)
+        # The silhouette of a sample alone in its cluster is 0
+        silhouette[own_counts == 1] = 0
+        scores.append(np.mean(np.nan_to_num(silhouette)))
+    return np.asarray(scores)
@@ -121,12 +121,21 @@ print(
 # The `KMeans` class implements a `transform` method that, given a set of data
 # points as an argument, computes the distance to the nearest centroid for each
 # of them. As a result, `KMeans` can be used as a preprocessing step in a
-# feature engineering pipeline as follows:
+# feature engineering pipeline as follows.
+#
+# Fitting `KMeans` with many clusters is much slower than fitting the ridge
+# model. We pass a `joblib.Memory` to the `memory` parameter of the pipeline:
+# the fitted preprocessing steps and the transformed data are stored on disk
+# and reused when the same steps are fitted on the same data again, e.g. by the
+# grid-search below for `n_clusters=100` or when re-executing this notebook.
+# The `get_memory` helper of this course returns a memory shared by all the
+# notebooks, whose size is bounded.
 
 # %%
 from sklearn.cluster import KMeans
 from sklearn.linear_model import Ridge
 from sklearn.pipeline import make_pipeline
+from pipeline_cache import get_memory
 
 model_cluster_geo = make_pipeline(
     make_column_transformer(
@@ -136,6 +145,7 @@ model_cluster_geo = make_pipeline(
     ),
     StandardScaler(),
     Ridge(alpha=1e-12),
+    memory=get_memory(),
 )
 test_error_cluster_geo = -cross_val_score(
     model_cluster_geo,
@@ -0,0 +1,100 @@
+"""Parallelism settings of the notebooks for each execution environment.
+
+The notebooks run in very different environments: JupyterLite, where
+everything runs in a single thread, a learner's laptop with a few cores, and
+the machines building the course, with many cores. A profile sets, for one
+environment:
+
+- `n_jobs`: number of workers of the outermost parallel loop of a cell, e.g.
+  a cross-validation, a parameter search or a forest fitted on its own;
+- `estimator_n_jobs`: number of workers of an estimator, or of a search,
+  nested inside such a parallel loop. Giving it more than one worker would
+  run `n_jobs * estimator_n_jobs` workers at once;
+- `blas_threads`: maximum number of threads of the BLAS and OpenMP thread
+  pools of the notebook process, applied with threadpoolctl. None keeps the
+  default of the libraries. Joblib already limits them in its workers.
+
+The profile is the value of the `SKLEARN_MOOC_COMPUTE_PROFILE` environment
+variable. It defaults to "jupyterlite" in JupyterLite and to "laptop"
+elsewhere. Each setting of the profile can be overridden with the
+`SKLEARN_MOOC_N_JOBS`, `SKLEARN_MOOC_ESTIMATOR_N_JOBS` and
+`SKLEARN_MOOC_BLAS_THREADS` environment variables.
+"""
+
+import os
+import sys
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from threadpoolctl import threadpool_limits
+
+PROFILE_ENV_VAR = "SKLEARN_MOOC_COMPUTE_PROFILE"
+OVERRIDE_ENV_VARS = {
+    "n_jobs": "SKLEARN_MOOC_N_JOBS",
+    "estimator_n_jobs": "SKLEARN_MOOC_ESTIMATOR_N_JOBS",
+    "blas_threads": "SKLEARN_MOOC_BLAS_THREADS",
+}
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Parallelism settings of an execution environment."""
+
+    n_jobs: int
+    estimator_n_jobs: int = 1
+    blas_threads: Optional[int] = None
+
+
+PROFILES = {
+    # Web workers cannot start processes, everything runs in one thread
+    "jupyterlite": Profile(n_jobs=1, estimator_n_jobs=1, blas_threads=1),
+    "laptop": Profile(n_jobs=2, estimator_n_jobs=1),
+    # For the notebooks jupyter-book executes itself, one after the other:
+    # their parallel loops use all the cores, the rest is single-threaded.
+    # build_tools/execute-notebooks.py runs several notebooks at once and
+    # overrides n_jobs and blas_threads with its --jobs option
+    "ci": Profile(n_jobs=-1, estimator_n_jobs=1, blas_threads=1),
+}
+
+
+def _default_profile_name():
+    if sys.platform == "emscripten":
+        return "jupyterlite"
+    return "laptop"
+
+
+def get_profile(name=None):
+    """Returns the profile of the current environment.
+
+    Parameters
+    ----------
+    name : str, default=None
+        Name of a profile of `PROFILES`. If None, it is read from the
+        `SKLEARN_MOOC_COMPUTE_PROFILE` environment variable, or guessed from
+        the platform.
+
+    Returns
+    -------
+    profile : Profile
+        The profile, with the overrides of the environment variables.
+    """
+    if name is None:
+        name = os.environ.get(PROFILE_ENV_VAR) or _default_profile_name()
+    if name not in PROFILES:
+        raise ValueError(
+            f"Unknown compute profile {name!r}, expected one of "
+            f"{sorted(PROFILES)}"
+        )
+
+    overrides = {}
+    for field_name, env_var in OVERRIDE_ENV_VARS.items():
+        value = os.environ.get(env_var)
+        if value:
+            overrides[field_name] = None if value == "none" else int(value)
+    return replace(PROFILES[name], **overrides)
+
+
+def apply_profile(profile):
+    """Limits the BLAS and OpenMP threads of the process to the profile's."""
+    if profile.blas_threads is not None:
+        threadpool_limits(limits=profile.blas_threads)
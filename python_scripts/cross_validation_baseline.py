@@ -51,10 +51,16 @@ cv = ShuffleSplit(n_splits=30, test_size=0.2, random_state=0)
 # %%
 from sklearn.tree import DecisionTreeRegressor
 from sklearn.model_selection import cross_validate
+from compute_config import N_JOBS
 
 regressor = DecisionTreeRegressor()
 cv_results_tree_regressor = cross_validate(
-    regressor, data, target, cv=cv, scoring="neg_mean_absolute_error", n_jobs=2
+    regressor,
+    data,
+    target,
+    cv=cv,
+    scoring="neg_mean_absolute_error",
+    n_jobs=N_JOBS,
 )
 
 errors_tree_regressor = pd.Series(
@@ -73,7 +79,12 @@ from sklearn.dummy import DummyRegressor
 
 dummy = DummyRegressor(strategy="mean")
 result_dummy = cross_validate(
-    dummy, data, target, cv=cv, scoring="neg_mean_absolute_error", n_jobs=2
+    dummy,
+    data,
+    target,
+    cv=cv,
+    scoring="neg_mean_absolute_error",
+    n_jobs=N_JOBS,
 )
 errors_dummy_regressor = pd.Series(
     -result_dummy["test_score"], name="Dummy regressor"
@@ -124,7 +135,13 @@ _ = plt.title("Cross-validation testing errors")
 
 # %%
 result_dummy = cross_validate(
-    dummy, data, target, cv=cv, scoring="r2", return_train_score=True, n_jobs=2
+    dummy,
+    data,
+    target,
+    cv=cv,
+    scoring="r2",
+    return_train_score=True,
+    n_jobs=N_JOBS,
 )
 r2_train_score_dummy_regressor = pd.Series(
     result_dummy["train_score"], name="Dummy regressor train score"
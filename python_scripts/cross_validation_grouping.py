@@ -44,9 +44,12 @@ model = make_pipeline(MinMaxScaler(), LogisticRegression(max_iter=1_000))
 
 # %%
 from sklearn.model_selection import cross_val_score, KFold
+from compute_config import N_JOBS
 
 cv = KFold(shuffle=False)
-test_score_no_shuffling = cross_val_score(model, data, target, cv=cv, n_jobs=2)
+test_score_no_shuffling = cross_val_score(
+    model, data, target, cv=cv, n_jobs=N_JOBS
+)
 print(
     "The average accuracy is "
     f"{test_score_no_shuffling.mean():.3f} ± "
@@ -60,7 +63,7 @@ print(
 # %%
 cv = KFold(shuffle=True)
 test_score_with_shuffling = cross_val_score(
-    model, data, target, cv=cv, n_jobs=2
+    model, data, target, cv=cv, n_jobs=N_JOBS
 )
 print(
     "The average accuracy is "
@@ -196,7 +199,7 @@ from sklearn.model_selection import GroupKFold
 
 cv = GroupKFold()
 test_score = cross_val_score(
-    model, data, target, groups=groups, cv=cv, n_jobs=2
+    model, data, target, groups=groups, cv=cv, n_jobs=N_JOBS
 )
 print(
     f"The average accuracy is {test_score.mean():.3f} ± {test_score.std():.3f}"
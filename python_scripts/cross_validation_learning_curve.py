@@ -80,6 +80,7 @@ cv = ShuffleSplit(n_splits=30, test_size=0.2)
 
 # %%
 from sklearn.model_selection import LearningCurveDisplay
+from compute_config import N_JOBS
 
 display = LearningCurveDisplay.from_estimator(
     regressor,
@@ -92,7 +93,7 @@ display = LearningCurveDisplay.from_estimator(
     negate_score=True,  # to use when metric starts with "neg_"
     score_name="Mean absolute error (k$)",
     std_display_style="errorbar",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 _ = display.ax_.set(xscale="log", title="Learning curve for decision tree")
 
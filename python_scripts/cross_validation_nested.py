@@ -36,11 +36,14 @@ data, target = load_breast_cancer(return_X_y=True)
 # %%
 from sklearn.model_selection import GridSearchCV
 from sklearn.svm import SVC
+from compute_config import ESTIMATOR_N_JOBS, N_JOBS
 
 param_grid = {"C": [0.1, 1, 10], "gamma": [0.01, 0.1]}
 model_to_tune = SVC()
 
-search = GridSearchCV(estimator=model_to_tune, param_grid=param_grid, n_jobs=2)
+search = GridSearchCV(
+    estimator=model_to_tune, param_grid=param_grid, n_jobs=N_JOBS
+)
 search.fit(data, target)
 
 # %% [markdown]
@@ -98,11 +101,14 @@ outer_cv = KFold(n_splits=3, shuffle=True, random_state=0)
 
 # Inner cross-validation for parameter search
 model = GridSearchCV(
-    estimator=model_to_tune, param_grid=param_grid, cv=inner_cv, n_jobs=2
+    estimator=model_to_tune,
+    param_grid=param_grid,
+    cv=inner_cv,
+    n_jobs=ESTIMATOR_N_JOBS,
 )
 
 # Outer cross-validation to compute the testing score
-test_score = cross_val_score(model, data, target, cv=outer_cv, n_jobs=2)
+test_score = cross_val_score(model, data, target, cv=outer_cv, n_jobs=N_JOBS)
 print(
     "The mean score using nested cross-validation is: "
     f"{test_score.mean():.3f} ± {test_score.std():.3f}"
@@ -118,29 +124,43 @@ print(
 # optimistic in practice. To do this, we repeat the experiment several times and
 # shuffle the data differently to ensure that our conclusion does not depend on
 # a particular resampling of the data.
+#
+# Each trial runs a grid search on the whole data and one grid search per
+# outer fold, and all those fits are independent from one trial to another.
+# Instead of running the trials one after the other, the
+# `repeated_nested_cross_validation` helper of this course runs the fits of all
+# the trials as a single list of tasks on one pool of workers. For each random
+# state `i`, it computes the same scores as the following code:
+#
+# ```python
+# inner_cv = KFold(n_splits=5, shuffle=True, random_state=i)
+# outer_cv = KFold(n_splits=3, shuffle=True, random_state=i)
+#
+# # Non-nested parameter search and scoring
+# model = GridSearchCV(
+#     estimator=model_to_tune, param_grid=param_grid, cv=inner_cv
+# )
+# model.fit(data, target)
+# test_score_not_nested = model.best_score_
+#
+# # Nested CV with parameter optimization
+# test_score_nested = cross_val_score(model, data, target, cv=outer_cv).mean()
+# ```
 
 # %%
-test_score_not_nested = []
-test_score_nested = []
+from model_selection_tools import repeated_nested_cross_validation
 
 N_TRIALS = 20
-for i in range(N_TRIALS):
-    # For each trial, we use cross-validation splits on independently
-    # randomly shuffled data by passing distinct values to the random_state
-    # parameter.
-    inner_cv = KFold(n_splits=5, shuffle=True, random_state=i)
-    outer_cv = KFold(n_splits=3, shuffle=True, random_state=i)
-
-    # Non_nested parameter search and scoring
-    model = GridSearchCV(
-        estimator=model_to_tune, param_grid=param_grid, cv=inner_cv, n_jobs=2
-    )
-    model.fit(data, target)
-    test_score_not_nested.append(model.best_score_)
-
-    # Nested CV with parameter optimization
-    test_score = cross_val_score(model, data, target, cv=outer_cv, n_jobs=2)
-    test_score_nested.append(test_score.mean())
+test_score_not_nested, test_score_nested = repeated_nested_cross_validation(
+    model_to_tune,
+    param_grid,
+    data,
+    target,
+    random_states=range(N_TRIALS),
+    inner_n_splits=5,
+    outer_n_splits=3,
+    n_jobs=N_JOBS,
+)
 
 # %% [markdown]
 # We can merge the data together and make a box plot of the two strategies.
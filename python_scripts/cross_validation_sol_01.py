@@ -73,9 +73,10 @@ model = make_pipeline(StandardScaler(), SVC())
 # %%
 # solution
 from sklearn.model_selection import cross_validate, ShuffleSplit
+from compute_config import N_JOBS
 
 cv = ShuffleSplit(random_state=0)
-cv_results = cross_validate(model, data, target, cv=cv, n_jobs=2)
+cv_results = cross_validate(model, data, target, cv=cv, n_jobs=N_JOBS)
 cv_results = pd.DataFrame(cv_results)
 cv_results
 
@@ -121,7 +122,7 @@ disp = ValidationCurveDisplay.from_estimator(
     score_name="Accuracy",
     std_display_style="errorbar",
     errorbar_kw={"alpha": 0.7},  # transparency for better visualization
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 _ = disp.ax_.set(
@@ -159,7 +160,7 @@ LearningCurveDisplay.from_estimator(
     score_name="Accuracy",
     std_display_style="errorbar",
     errorbar_kw={"alpha": 0.7},  # transparency for better visualization
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 _ = disp.ax_.set(title="Learning curve for support vector machine")
@@ -50,9 +50,10 @@ classifier = make_pipeline(StandardScaler(), LogisticRegression())
 # %%
 # solution
 from sklearn.model_selection import cross_validate
+from compute_config import N_JOBS
 
 cv_results_logistic_regression = cross_validate(
-    classifier, data, target, cv=cv, n_jobs=2
+    classifier, data, target, cv=cv, n_jobs=N_JOBS
 )
 
 test_score_logistic_regression = pd.Series(
@@ -75,7 +76,7 @@ from sklearn.dummy import DummyClassifier
 
 most_frequent_classifier = DummyClassifier(strategy="most_frequent")
 cv_results_most_frequent = cross_validate(
-    most_frequent_classifier, data, target, cv=cv, n_jobs=2
+    most_frequent_classifier, data, target, cv=cv, n_jobs=N_JOBS
 )
 test_score_most_frequent = pd.Series(
     cv_results_most_frequent["test_score"],
@@ -138,7 +139,7 @@ _ = plt.title("Distribution of the CV scores")
 # solution
 stratified_dummy = DummyClassifier(strategy="stratified")
 cv_results_stratified = cross_validate(
-    stratified_dummy, data, target, cv=cv, n_jobs=2
+    stratified_dummy, data, target, cv=cv, n_jobs=N_JOBS
 )
 test_score_dummy_stratified = pd.Series(
     cv_results_stratified["test_score"], name="Stratified class predictor"
@@ -147,7 +148,7 @@ test_score_dummy_stratified = pd.Series(
 # %% tags=["solution"]
 uniform_dummy = DummyClassifier(strategy="uniform")
 cv_results_uniform = cross_validate(
-    uniform_dummy, data, target, cv=cv, n_jobs=2
+    uniform_dummy, data, target, cv=cv, n_jobs=N_JOBS
 )
 test_score_dummy_uniform = pd.Series(
     cv_results_uniform["test_score"], name="Uniform class predictor"
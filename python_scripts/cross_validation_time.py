@@ -28,6 +28,7 @@
 
 # %%
 import pandas as pd
+from dataset_tools import load_price_panel
 
 symbols = {
     "TOT": "Total",
@@ -36,15 +37,9 @@ symbols = {
     "COP": "ConocoPhillips",
     "VLO": "Valero Energy",
 }
-template_name = "../datasets/financial-data/{}.csv"
-
-quotes = {}
-for symbol in symbols:
-    data = pd.read_csv(
-        template_name.format(symbol), index_col=0, parse_dates=True
-    )
-    quotes[symbols[symbol]] = data["open"]
-quotes = pd.DataFrame(quotes)
+# Opening prices of the symbols, one column per symbol, aligned on their dates
+quotes = load_price_panel(list(symbols), column="open")
+quotes = quotes.rename(columns=symbols)
 
 # %% [markdown]
 # We can start by plotting the different financial quotations.
@@ -90,8 +85,9 @@ cv = ShuffleSplit(random_state=0)
 
 # %%
 from sklearn.model_selection import cross_val_score
+from compute_config import N_JOBS
 
-test_score = cross_val_score(regressor, data, target, cv=cv, n_jobs=2)
+test_score = cross_val_score(regressor, data, target, cv=cv, n_jobs=N_JOBS)
 print(f"The mean R2 is: {test_score.mean():.2f} ± {test_score.std():.2f}")
 
 # %% [markdown]
@@ -203,7 +199,7 @@ from sklearn.model_selection import LeaveOneGroupOut
 groups = quotes.index.to_period("Q")
 cv = LeaveOneGroupOut()
 test_score = cross_val_score(
-    regressor, data, target, cv=cv, groups=groups, n_jobs=2
+    regressor, data, target, cv=cv, groups=groups, n_jobs=N_JOBS
 )
 print(f"The mean R2 is: {test_score.mean():.2f} ± {test_score.std():.2f}")
 
@@ -221,7 +217,7 @@ print(f"The mean R2 is: {test_score.mean():.2f} ± {test_score.std():.2f}")
 from sklearn.model_selection import TimeSeriesSplit
 
 cv = TimeSeriesSplit(n_splits=groups.nunique())
-test_score = cross_val_score(regressor, data, target, cv=cv, n_jobs=2)
+test_score = cross_val_score(regressor, data, target, cv=cv, n_jobs=N_JOBS)
 print(f"The mean R2 is: {test_score.mean():.2f} ± {test_score.std():.2f}")
 
 # %% [markdown]
@@ -51,6 +51,7 @@ regressor = DecisionTreeRegressor()
 
 # %%
 from sklearn.model_selection import cross_validate, ShuffleSplit
+from compute_config import N_JOBS
 
 cv = ShuffleSplit(n_splits=30, test_size=0.2, random_state=0)
 cv_results = cross_validate(
@@ -60,7 +61,7 @@ cv_results = cross_validate(
     cv=cv,
     scoring="neg_mean_absolute_error",
     return_train_score=True,
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 cv_results = pd.DataFrame(cv_results)
 
@@ -129,7 +130,7 @@ disp = ValidationCurveDisplay.from_estimator(
     scoring="neg_mean_absolute_error",
     negate_score=True,
     std_display_style="errorbar",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 _ = disp.ax_.set(
     xlabel="Maximum depth of decision tree",
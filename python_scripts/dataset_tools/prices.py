@@ -0,0 +1,122 @@
+"""Panel of the stock prices of the financial-data folder.
+
+The time series lessons use the prices of several symbols aligned on the same
+dates, one column per symbol. Reading and aligning one file per symbol takes
+a time proportional to the number of symbols. The first time a panel is
+loaded, the aligned prices are stored in the `.cache` folder of the datasets
+folder as a single float64 NumPy file, with the dates in a second NumPy file.
+Later loads memory-map both files, whatever the number of symbols.
+
+The cache file name contains a hash of the symbols, of the price column and
+of the size and modification time of the CSV files, so that editing a CSV
+file builds the panel again.
+"""
+
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+from .cache import CACHE_DIR, write_atomic
+from .registry import DATASETS, FINANCIAL_DATA_SYMBOLS, load_dataset
+
+
+def _hash_panel(symbols, column):
+    key = [column]
+    for symbol in symbols:
+        stat = DATASETS[f"financial-data/{symbol}"].path.stat()
+        key.append(f"{symbol}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+
+
+def panel_path(symbols, column):
+    """Returns the path of the cached panel, without suffix."""
+    return CACHE_DIR / f"prices-{column}-{_hash_panel(symbols, column)}"
+
+
+def _write_cache(panel, path):
+    columns = [str(col) for col in panel.columns]
+    write_atomic(
+        lambda f: f.write(json.dumps(columns).encode()),
+        path.with_suffix(".json"),
+    )
+    dates = panel.index.to_numpy()
+    write_atomic(
+        lambda f: np.save(f, dates, allow_pickle=False),
+        path.with_suffix(".dates.npy"),
+    )
+    # The values are written last: the panel is read only if they exist
+    values = np.ascontiguousarray(panel, dtype=np.float64)
+    write_atomic(
+        lambda f: np.save(f, values, allow_pickle=False),
+        path.with_suffix(".npy"),
+    )
+
+
+def _read_cache(path):
+    if not path.with_suffix(".npy").exists():
+        return None
+    values = np.load(path.with_suffix(".npy"), mmap_mode="r")
+    dates = np.load(path.with_suffix(".dates.npy"), mmap_mode="r")
+    columns = json.loads(path.with_suffix(".json").read_text())
+    return pd.DataFrame(
+        values,
+        index=pd.DatetimeIndex(dates, name="date"),
+        columns=columns,
+        copy=False,
+    )
+
+
+def _align(symbols, column):
+    # Dates missing for some of the symbols are NaN in their columns
+    panel = pd.DataFrame(
+        {
+            symbol: load_dataset(f"financial-data/{symbol}")[column]
+            for symbol in symbols
+        }
+    )
+    return panel.sort_index()
+
+
+def load_price_panel(symbols=None, column="open"):
+    """Loads the prices of several symbols aligned on their dates.
+
+    Parameters
+    ----------
+    symbols : list of str, default=None
+        Symbols of the financial-data folder, e.g. ["XOM", "CVX"]. All the
+        symbols if None.
+    column : {"open", "close"}, default="open"
+        The price to load.
+
+    Returns
+    -------
+    panel : DataFrame of shape (n_dates, n_symbols)
+        The prices, one column per symbol, indexed by the sorted union of the
+        dates of the symbols. Its values are read-only.
+    """
+    symbols = list(FINANCIAL_DATA_SYMBOLS if symbols is None else symbols)
+    unknown = [
+        symbol
+        for symbol in symbols
+        if f"financial-data/{symbol}" not in DATASETS
+    ]
+    if unknown:
+        raise ValueError(
+            f"Unknown symbols {unknown}, available symbols are:"
+            f" {FINANCIAL_DATA_SYMBOLS}"
+        )
+
+    path = panel_path(symbols, column)
+    panel = _read_cache(path)
+    if panel is not None:
+        return panel
+
+    panel = _align(symbols, column)
+    try:
+        _write_cache(panel, path)
+    except OSError:
+        # e.g. read-only file system, the cache is only an optimization
+        return panel
+    return _read_cache(path)
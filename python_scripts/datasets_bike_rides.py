@@ -209,3 +209,25 @@ _ = sns.pairplot(data=subset, hue="power", palette="viridis")
 # on the body. We can confirm this intuition by looking at the interaction
 # between the slope and the speed: a lower speed with a higher slope is usually
 # associated with higher power.
+
+# %% [markdown]
+# ## Reading longer ride logs
+#
+# This file only holds four rides and fits in memory. Logs of many more rides
+# can be read in chunks with the `dataset_tools` package of the course, e.g. to
+# get one row per ride without loading the whole file. A new ride starts after
+# a gap of more than one hour between two records.
+
+# %%
+from dataset_tools import ride_groups, ride_summary
+
+rides = ride_summary("../datasets/bike_rides.csv", chunksize=10_000)
+rides[["start", "end", "n_samples", "power_mean", "heart-rate_mean"]]
+
+# %% [markdown]
+# `ride_groups` gives the ride of each record, e.g. to evaluate a model on rides
+# that were not used for training with a `LeaveOneGroupOut` cross-validation.
+
+# %%
+groups = ride_groups(rides)
+np.unique(groups, return_counts=True)
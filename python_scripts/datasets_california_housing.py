@@ -199,6 +199,7 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.linear_model import RidgeCV
 from sklearn.pipeline import make_pipeline
 from sklearn.model_selection import cross_validate
+from compute_config import N_JOBS
 
 alphas = np.logspace(-3, 1, num=30)
 model = make_pipeline(StandardScaler(), RidgeCV(alphas=alphas))
@@ -207,7 +208,7 @@ cv_results = cross_validate(
     california_housing.data,
     california_housing.target,
     return_estimator=True,
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 # %%
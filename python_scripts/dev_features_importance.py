@@ -251,6 +251,7 @@ plt.subplots_adjust(left=0.3)
 # %%
 from sklearn.model_selection import cross_validate
 from sklearn.model_selection import RepeatedKFold
+from compute_config import N_JOBS
 
 cv_model = cross_validate(
     model,
@@ -258,7 +259,7 @@ cv_model = cross_validate(
     y,
     cv=RepeatedKFold(n_splits=5, n_repeats=5),
     return_estimator=True,
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 coefs = pd.DataFrame(
     [model[1].coef_ for model in cv_model["estimator"]],
@@ -323,7 +324,7 @@ cv_model = cross_validate(
     y,
     cv=RepeatedKFold(n_splits=5, n_repeats=5),
     return_estimator=True,
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 coefs = pd.DataFrame(
     [model[1].coef_ for model in cv_model["estimator"]],
@@ -511,7 +512,7 @@ print(
 
 
 # %%
-def permutation_importance(model, X, y, n_repeats=10):
+def permutation_importance_loop(model, X, y, n_repeats=10):
     """Calculate importance score for each feature."""
 
     importances = []
@@ -531,6 +532,81 @@ def permutation_importance(model, X, y, n_repeats=10):
     }
 
 
+# %% [markdown]
+# This loop copies the whole dataset and recomputes the baseline score for each
+# feature and each repetition, and the model predicts one permuted copy at a
+# time. We can do better:
+#
+# - the baseline score does not depend on the permuted feature, we compute it
+#   once;
+# - the `n_repeats` permuted copies of the data are stacked in a single array,
+#   so that the model predicts all of them in a single call. This array is
+#   allocated once and only the permuted column is modified;
+# - the features are independent from each other, they can be processed in
+#   parallel.
+
+
+# %%
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.metrics import r2_score
+
+
+def _permuted_scores(model, X, y, feature_indices, seeds, n_repeats, metric):
+    """return the scores of model when each feature of feature_indices is
+    permuted, n_repeats times"""
+
+    n_samples = X.shape[0]
+    # stacked copies of the data, shared by all the features of this worker
+    X_stacked = np.tile(X.to_numpy(dtype=np.float64), (n_repeats, 1))
+    y_stacked = np.tile(np.asarray(y), (n_repeats, 1)).T
+
+    scores = []
+    for col_idx, seed in zip(feature_indices, seeds):
+        rng = np.random.RandomState(seed)
+        column = X_stacked[:n_samples, col_idx].copy()
+        for n_round in range(n_repeats):
+            X_stacked[
+                n_round * n_samples : (n_round + 1) * n_samples, col_idx
+            ] = rng.permutation(column)
+
+        y_pred = model.predict(pd.DataFrame(X_stacked, columns=X.columns))
+        # one column of predictions per repetition
+        y_pred = y_pred.reshape(n_repeats, n_samples).T
+        scores.append(metric(y_stacked, y_pred, multioutput="raw_values"))
+
+        X_stacked[:, col_idx] = np.tile(column, n_repeats)
+    return scores
+
+
+def permutation_importance(
+    model, X, y, n_repeats=10, metric=r2_score, n_jobs=None, random_state=None
+):
+    """Calculate importance score for each feature."""
+
+    baseline_score = metric(y, model.predict(X))
+
+    rng = np.random.RandomState(random_state)
+    # one seed per feature so that the result does not depend on n_jobs
+    seeds = rng.randint(np.iinfo(np.int32).max, size=X.shape[1])
+    n_chunks = min(effective_n_jobs(n_jobs), X.shape[1])
+    chunks = np.array_split(np.arange(X.shape[1]), n_chunks)
+    scores = Parallel(n_jobs=n_jobs)(
+        delayed(_permuted_scores)(
+            model, X, y, chunk, seeds[chunk], n_repeats, metric
+        )
+        for chunk in chunks
+        if len(chunk)
+    )
+
+    # feature importance is the difference between the two scores
+    importances = baseline_score - np.concatenate(scores)
+    return {
+        "importances_mean": np.mean(importances, axis=1),
+        "importances_std": np.std(importances, axis=1),
+        "importances": importances.tolist(),
+    }
+
+
 # This function could directly be access from sklearn
 # from sklearn.inspection import permutation_importance
 
@@ -557,7 +633,7 @@ def plot_feature_importances(perm_importance_result, feat_name):
 
 # %%
 perm_importance_result_train = permutation_importance(
-    model, X_train, y_train, n_repeats=10
+    model, X_train, y_train, n_repeats=10, n_jobs=N_JOBS, random_state=0
 )
 
 plot_feature_importances(perm_importance_result_train, X_train.columns)
@@ -195,17 +195,37 @@ adaboost = AdaBoostClassifier(
 )
 adaboost.fit(data, target)
 
+# %% [markdown]
+# To look at each round, we record the predictions of each tree on the training
+# data and the weights of the samples when fitting it, once for all the rounds.
+# We also record the predictions of each tree on a grid covering the feature
+# space, the same grid as the one used by
+# `DecisionBoundaryDisplay.from_estimator`, to plot the decision boundaries
+# without predicting again.
+
+# %%
+from ensemble_tools import trace_adaboost
+
+xx0, xx1 = np.meshgrid(
+    np.linspace(data.iloc[:, 0].min() - 1, data.iloc[:, 0].max() + 1, 100),
+    np.linspace(data.iloc[:, 1].min() - 1, data.iloc[:, 1].max() + 1, 100),
+)
+grid = np.c_[xx0.ravel(), xx1.ravel()]
+trace = trace_adaboost(adaboost, data, target, X_eval=grid)
+
 # %%
-for boosting_round, tree in enumerate(adaboost.estimators_):
+for boosting_round in range(trace.n_rounds):
     plt.figure()
-    # we convert `data` into a NumPy array to avoid a warning raised in scikit-learn
-    DecisionBoundaryDisplay.from_estimator(
-        tree,
-        data.to_numpy(),
-        response_method="predict",
-        cmap="RdBu",
-        alpha=0.5,
-    )
+    # encode the predicted classes as integers, as done by `from_estimator`
+    response = np.searchsorted(
+        adaboost.classes_, trace.eval_predictions[boosting_round]
+    ).reshape(xx0.shape)
+    DecisionBoundaryDisplay(
+        xx0=xx0,
+        xx1=xx1,
+        n_classes=len(adaboost.classes_),
+        response=response,
+    ).plot(cmap="RdBu", alpha=0.5)
     sns.scatterplot(
         x=culmen_columns[0],
         y=culmen_columns[1],
@@ -213,9 +233,33 @@ for boosting_round, tree in enumerate(adaboost.estimators_):
         data=penguins,
         palette=palette,
     )
+    sns.scatterplot(
+        data=data[trace.residuals[boosting_round]],
+        x=culmen_columns[0],
+        y=culmen_columns[1],
+        label="Misclassified samples",
+        marker="+",
+        s=150,
+        color="k",
+    )
     plt.legend(bbox_to_anchor=(1.04, 0.5), loc="center left")
     _ = plt.title(f"Decision tree trained at round {boosting_round}")
 
+# %% [markdown]
+# The samples misclassified by a tree get a larger weight when fitting the tree
+# of the next round.
+
+# %%
+for boosting_round in range(1, trace.n_rounds):
+    previously_misclassified = trace.residuals[boosting_round - 1]
+    sample_weight = trace.sample_weights[boosting_round]
+    print(
+        f"Round {boosting_round}: mean weight of the samples misclassified at"
+        " the previous round"
+        f" {sample_weight[previously_misclassified].mean():.4f}, of the other"
+        f" samples {sample_weight[~previously_misclassified].mean():.4f}"
+    )
+
 # %%
 print(f"Weight of each classifier: {adaboost.estimator_weights_}")
 
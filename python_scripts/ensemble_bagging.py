@@ -267,6 +267,79 @@ _ = plt.title("Predictions of bagged trees")
 # As a result, the bag of trees as a whole is less likely to overfit than the
 # individual trees.
 #
+# ## Bagging many trees
+#
+# Our loop draws one bootstrap sample at a time and copies the selected rows
+# with `.iloc`. With hundreds of trees, these copies become costly. Instead, we
+# can draw all the bootstrap samples at once. Since a bootstrap sample only
+# differs from the original dataset by the number of times each data point is
+# repeated, we represent it by these counts rather than by a copy of the data.
+
+
+# %%
+def bootstrap_weights(n_samples, n_bootstraps, seed=0):
+    # Number of times each data point is drawn in each bootstrap sample: one
+    # row per bootstrap sample, summing to `n_samples`
+    rng = np.random.default_rng(seed)
+    return rng.multinomial(
+        n_samples, np.full(n_samples, 1 / n_samples), size=n_bootstraps
+    )
+
+
+bootstrap_weights(n_samples=10, n_bootstraps=3)
+
+# %% [markdown]
+# Training a tree with these counts as `sample_weight` is approximately
+# equivalent to training it on the resampled data, without copying any row. It
+# is not exactly equivalent: the samples with a zero weight are still in the
+# data seen by the tree. They count in `min_samples_split` and
+# `min_samples_leaf`, which are numbers of samples and not sums of weights, and
+# the thresholds of the splits are placed halfway between consecutive values of
+# a feature, including the values of these samples.
+#
+# The trees are independent from each other so we can fit them in parallel. We
+# convert the data to NumPy arrays once, and each parallel task fits a tree and
+# predicts the test data, so that the predictions of all the trees are computed
+# in a single pass and stacked in a single array.
+
+# %%
+from joblib import Parallel, delayed
+from compute_config import N_JOBS
+
+
+def fit_predict_tree(data_train, target_train, sample_weight, data_test):
+    tree = DecisionTreeRegressor(max_depth=3, random_state=0)
+    tree.fit(data_train, target_train, sample_weight=sample_weight)
+    return tree.predict(data_test)
+
+
+n_bootstraps = 100
+weights = bootstrap_weights(target_train.shape[0], n_bootstraps)
+data_train_array = data_train.to_numpy()
+data_test_array = data_test.to_numpy()
+# one row of predictions per tree
+many_trees_predictions = np.stack(
+    Parallel(n_jobs=N_JOBS)(
+        delayed(fit_predict_tree)(
+            data_train_array, target_train, sample_weight, data_test_array
+        )
+        for sample_weight in weights
+    )
+)
+
+# %%
+sns.scatterplot(
+    x=data_train["Feature"], y=target_train, color="black", alpha=0.5
+)
+plt.plot(
+    data_test["Feature"],
+    many_trees_predictions.mean(axis=0),
+    label="Averaged predictions",
+)
+plt.legend()
+_ = plt.title(f"Predictions of {n_bootstraps} bagged trees")
+
+# %% [markdown]
 # ## Bagging in scikit-learn
 #
 # Scikit-learn implements the bagging procedure as a **meta-estimator**, that is,
@@ -274,8 +347,8 @@ _ = plt.title("Predictions of bagged trees")
 # cloned several times and trained independently on each bootstrap sample.
 #
 # The following code snippet shows how to build a bagging ensemble of decision
-# trees. We set `n_estimators=100` instead of 3 in our manual implementation
-# above to get a stronger smoothing effect.
+# trees. We set `n_estimators=100` instead of 3 in our first manual
+# implementation above to get a stronger smoothing effect.
 
 # %%
 from sklearn.ensemble import BaggingRegressor
@@ -165,10 +165,11 @@ _ = ax.set_title("Prediction of the initial residuals")
 # this sample in `data_train`.
 
 # %%
-sample = data_train.iloc[[-7]]
+sample_index = -7
+sample = data_train.iloc[[sample_index]]
 x_sample = sample["Feature"].iloc[0]
-target_true = target_train.iloc[-7]
-target_true_residual = residuals.iloc[-7]
+target_true = target_train.iloc[sample_index]
+target_true_residual = residuals.iloc[sample_index]
 
 # %% [markdown]
 # Let's plot the original data, the predictions of the initial decision tree and
@@ -220,7 +221,7 @@ _ = ax.set_title("Zoom of sample of interest\nin the initial residuals")
 # %%
 print(f"True value to predict for f(x={x_sample:.3f}) = {target_true:.3f}")
 
-y_pred_first_tree = tree.predict(sample)[0]
+y_pred_first_tree = target_train_predicted[sample_index]
 print(
     f"Prediction of the first decision tree for x={x_sample:.3f}: "
     f"y={y_pred_first_tree:.3f}"
@@ -234,7 +235,7 @@ print(f"Error of the tree: {target_true - y_pred_first_tree:.3f}")
 # %%
 print(
     f"Prediction of the residual for x={x_sample:.3f}: "
-    f"{tree_residuals.predict(sample)[0]:.3f}"
+    f"{target_train_predicted_residuals[sample_index]:.3f}"
 )
 
 # %% [markdown]
@@ -244,7 +245,7 @@ print(
 
 # %%
 y_pred_first_and_second_tree = (
-    y_pred_first_tree + tree_residuals.predict(sample)[0]
+    y_pred_first_tree + target_train_predicted_residuals[sample_index]
 )
 print(
     "Prediction of the first and second decision trees combined for "
@@ -260,6 +261,47 @@ print(f"Error of the tree: {target_true - y_pred_first_and_second_tree:.3f}")
 # second tree corrects the first tree's error, while the third tree corrects the
 # second tree's error and so on).
 #
+# `trace_residual_boosting` repeats the steps above for a list of trees: each
+# tree is fitted on the residuals of the sum of the previous ones. It records
+# the predictions of each tree and the residuals after each round, on the
+# training data and on `data_test`, so that we can look at any round without
+# predicting again.
+
+# %%
+from ensemble_tools import trace_residual_boosting
+
+trees = [DecisionTreeRegressor(max_depth=3, random_state=0) for _ in range(5)]
+trace, _ = trace_residual_boosting(
+    trees, data_train, target_train, X_eval=data_test
+)
+
+for boosting_round in range(trace.n_rounds):
+    mean_absolute_residual = np.abs(trace.residuals[boosting_round]).mean()
+    print(
+        f"Mean absolute residual after {boosting_round + 1} tree(s): "
+        f"{mean_absolute_residual:.3f}"
+    )
+
+# %% [markdown]
+# The prediction of the ensemble is the sum of the predictions of its trees.
+
+# %%
+ensemble_test_predicted = trace.eval_predictions.cumsum(axis=0)
+
+_, ax = plt.subplots()
+sns.scatterplot(
+    x=data_train["Feature"], y=target_train, color="black", alpha=0.5, ax=ax
+)
+for n_trees in [1, 2, 5]:
+    ax.plot(
+        data_test["Feature"],
+        ensemble_test_predicted[n_trees - 1],
+        label=f"{n_trees} tree(s)",
+    )
+ax.legend(bbox_to_anchor=(1.05, 0.8), loc="upper left")
+_ = ax.set_title("Predictions of the sum of the first trees")
+
+# %% [markdown]
 # ## First comparison of GBDT vs. random forests
 #
 # We now compare the generalization performance of random-forest and gradient
@@ -278,6 +320,7 @@ target *= 100  # rescale the target in k$
 
 # %%
 from sklearn.ensemble import GradientBoostingRegressor
+from compute_config import ESTIMATOR_N_JOBS, N_JOBS
 
 gradient_boosting = GradientBoostingRegressor(n_estimators=200)
 cv_results_gbdt = cross_validate(
@@ -285,7 +328,7 @@ cv_results_gbdt = cross_validate(
     data,
     target,
     scoring="neg_mean_absolute_error",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 # %%
@@ -303,13 +346,15 @@ print(
 # %%
 from sklearn.ensemble import RandomForestRegressor
 
-random_forest = RandomForestRegressor(n_estimators=200, n_jobs=2)
+random_forest = RandomForestRegressor(
+    n_estimators=200, n_jobs=ESTIMATOR_N_JOBS
+)
 cv_results_rf = cross_validate(
     random_forest,
     data,
     target,
     scoring="neg_mean_absolute_error",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 # %%
@@ -56,6 +56,7 @@ target *= 100  # rescale the target in k$
 # %%
 from sklearn.model_selection import cross_validate
 from sklearn.ensemble import GradientBoostingRegressor
+from compute_config import N_JOBS
 
 gradient_boosting = GradientBoostingRegressor(n_estimators=200)
 cv_results_gbdt = cross_validate(
@@ -63,7 +64,7 @@ cv_results_gbdt = cross_validate(
     data,
     target,
     scoring="neg_mean_absolute_error",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 # %%
@@ -127,7 +128,7 @@ cv_results_gbdt = cross_validate(
     data,
     target,
     scoring="neg_mean_absolute_error",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 # %%
@@ -166,7 +167,7 @@ cv_results_hgbdt = cross_validate(
     data,
     target,
     scoring="neg_mean_absolute_error",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 # %%
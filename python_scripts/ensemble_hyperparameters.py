@@ -88,6 +88,7 @@ print(f"In this case, n_features={len(data.columns)}")
 # %%
 from sklearn.model_selection import RandomizedSearchCV
 from sklearn.ensemble import RandomForestRegressor
+from compute_config import ESTIMATOR_N_JOBS, N_JOBS
 
 param_distributions = {
     "max_features": [1, 2, 3, 5, None],
@@ -95,12 +96,12 @@ param_distributions = {
     "min_samples_leaf": [1, 2, 5, 10, 20, 50, 100],
 }
 search_cv = RandomizedSearchCV(
-    RandomForestRegressor(n_jobs=2),
+    RandomForestRegressor(n_jobs=ESTIMATOR_N_JOBS),
     param_distributions=param_distributions,
     scoring="neg_mean_absolute_error",
     n_iter=10,
     random_state=0,
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 search_cv.fit(data_train, target_train)
 
@@ -188,7 +189,7 @@ search_cv = RandomizedSearchCV(
     scoring="neg_mean_absolute_error",
     n_iter=20,
     random_state=0,
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 search_cv.fit(data_train, target_train)
 
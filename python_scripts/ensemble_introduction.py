@@ -40,9 +40,10 @@ target *= 100  # rescale the target in k$
 # %%
 from sklearn.model_selection import cross_validate
 from sklearn.tree import DecisionTreeRegressor
+from compute_config import ESTIMATOR_N_JOBS, N_JOBS
 
 tree = DecisionTreeRegressor(random_state=0)
-cv_results = cross_validate(tree, data, target, n_jobs=2)
+cv_results = cross_validate(tree, data, target, n_jobs=N_JOBS)
 scores = cv_results["test_score"]
 
 print(
@@ -82,10 +83,10 @@ tree = GridSearchCV(
     DecisionTreeRegressor(random_state=0),
     param_grid=param_grid,
     cv=cv,
-    n_jobs=2,
+    n_jobs=ESTIMATOR_N_JOBS,
 )
 cv_results = cross_validate(
-    tree, data, target, n_jobs=2, return_estimator=True
+    tree, data, target, n_jobs=N_JOBS, return_estimator=True
 )
 scores = cv_results["test_score"]
 
@@ -122,7 +123,7 @@ bagging_regressor = BaggingRegressor(
     estimator=estimator, n_estimators=20, random_state=0
 )
 
-cv_results = cross_validate(bagging_regressor, data, target, n_jobs=2)
+cv_results = cross_validate(bagging_regressor, data, target, n_jobs=N_JOBS)
 scores = cv_results["test_score"]
 
 print(
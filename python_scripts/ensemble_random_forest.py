@@ -102,13 +102,14 @@ print(
 
 # %%
 from sklearn.ensemble import BaggingClassifier
+from compute_config import N_JOBS
 
 bagged_trees = make_pipeline(
     preprocessor,
     BaggingClassifier(
         estimator=DecisionTreeClassifier(random_state=0),
         n_estimators=50,
-        n_jobs=2,
+        n_jobs=N_JOBS,
         random_state=0,
     ),
 )
@@ -134,7 +135,7 @@ from sklearn.ensemble import RandomForestClassifier
 
 random_forest = make_pipeline(
     preprocessor,
-    RandomForestClassifier(n_estimators=50, n_jobs=2, random_state=0),
+    RandomForestClassifier(n_estimators=50, n_jobs=N_JOBS, random_state=0),
 )
 
 # %%
@@ -45,9 +45,10 @@ data_train, data_test, target_train, target_test = train_test_split(
 from sklearn.metrics import mean_absolute_error
 from sklearn.tree import DecisionTreeRegressor
 from sklearn.ensemble import BaggingRegressor
+from compute_config import N_JOBS
 
 tree = DecisionTreeRegressor()
-bagging = BaggingRegressor(estimator=tree, n_jobs=2)
+bagging = BaggingRegressor(estimator=tree, n_jobs=N_JOBS)
 bagging.fit(data_train, target_train)
 target_predicted = bagging.predict(data_test)
 print(
@@ -72,6 +72,7 @@ forest = RandomForestRegressor(max_depth=None)
 import numpy as np
 
 from sklearn.model_selection import ValidationCurveDisplay
+from compute_config import N_JOBS
 
 param_range = np.array([1, 2, 5, 10, 20, 50, 100, 200])
 disp = ValidationCurveDisplay.from_estimator(
@@ -83,7 +84,7 @@ disp = ValidationCurveDisplay.from_estimator(
     scoring="neg_mean_absolute_error",
     negate_score=True,
     std_display_style="errorbar",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 _ = disp.ax_.set(
@@ -101,17 +102,30 @@ _ = disp.ax_.set(
 
 # %%
 # solution
-disp = ValidationCurveDisplay.from_estimator(
+from model_selection_tools import incremental_validation_curve
+
+# A gradient boosting model with 200 trees already contains the models with
+# fewer trees: `incremental_validation_curve` reads their predictions after
+# each tree with `staged_predict`, fitting a single model per fold instead of
+# one per number of trees. The scores are the ones computed by
+# `ValidationCurveDisplay.from_estimator`, so we plot them with the same
+# display.
+train_scores, test_scores = incremental_validation_curve(
     gbdt,
     data_train,
     target_train,
+    param_range,
+    scoring="neg_mean_absolute_error",
+    n_jobs=N_JOBS,
+)
+disp = ValidationCurveDisplay(
     param_name="n_estimators",
     param_range=param_range,
-    scoring="neg_mean_absolute_error",
-    negate_score=True,
-    std_display_style="errorbar",
-    n_jobs=2,
+    train_scores=train_scores,
+    test_scores=test_scores,
+    score_name="neg_mean_absolute_error",
 )
+disp.plot(negate_score=True, std_display_style="errorbar")
 
 _ = disp.ax_.set(
     xlabel="Number of trees in the gradient boosting model",
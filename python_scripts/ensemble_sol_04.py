@@ -72,10 +72,11 @@ search = GridSearchCV(hist_gbdt, params)
 # solution
 from sklearn.model_selection import cross_validate
 from sklearn.model_selection import KFold
+from compute_config import N_JOBS
 
 cv = KFold(n_splits=5, shuffle=True, random_state=0)
 results = cross_validate(
-    search, data, target, cv=cv, return_estimator=True, n_jobs=2
+    search, data, target, cv=cv, return_estimator=True, n_jobs=N_JOBS
 )
 
 # %% [markdown]
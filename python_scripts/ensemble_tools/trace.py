@@ -0,0 +1,181 @@
+"""Round by round trace of a boosting ensemble.
+
+The boosting lessons look at what happens at each round of an ensemble: the
+predictions of the new learner, the errors it leaves to the next one and the
+weights of the samples it was fitted with. Instead of predicting again with
+each learner, or with each prefix of the ensemble, for every plot, a trace
+records all of them in arrays of shape `(n_rounds, n_samples)`, filled in a
+single pass over the rounds. The plots then index the trace by round.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from sklearn.base import clone
+
+
+@dataclass
+class BoostingTrace:
+    """Predictions, errors and sample weights of each round of a boosting
+    ensemble.
+
+    Attributes
+    ----------
+    learner_predictions : ndarray of shape (n_rounds, n_samples)
+        Predictions of the learner of each round on the training data.
+    ensemble_predictions : ndarray of shape (n_rounds, n_samples)
+        Predictions of the ensemble made of the first rounds.
+    residuals : ndarray of shape (n_rounds, n_samples)
+        Errors left to the next round: for regression, the target minus the
+        predictions of the ensemble; for classification, whether the learner
+        misclassifies each sample.
+    sample_weights : ndarray of shape (n_rounds, n_samples)
+        Weights of the samples when fitting the learner of each round.
+    eval_predictions : ndarray of shape (n_rounds, n_eval_samples) or None
+        Predictions of the learner of each round on `X_eval`, if any.
+    """
+
+    learner_predictions: np.ndarray
+    ensemble_predictions: np.ndarray
+    residuals: np.ndarray
+    sample_weights: np.ndarray
+    eval_predictions: Optional[np.ndarray] = None
+
+    @property
+    def n_rounds(self):
+        return self.learner_predictions.shape[0]
+
+
+def trace_residual_boosting(learners, X, y, X_eval=None):
+    """Fits each learner on the residuals of the previous ones.
+
+    This is gradient boosting of the squared error with a learning rate of 1:
+    the first learner is fitted on `y` and each next one on the residuals of
+    the sum of the predictions of the previous learners.
+
+    Parameters
+    ----------
+    learners : list of estimators
+        The regressor of each round, cloned before fitting.
+    X : array-like of shape (n_samples, n_features)
+        The training data.
+    y : array-like of shape (n_samples,)
+        The target.
+    X_eval : array-like of shape (n_eval_samples, n_features), default=None
+        Data not used for fitting, e.g. held-out samples, on which to record
+        the predictions of the learners.
+
+    Returns
+    -------
+    trace : BoostingTrace
+        The trace of the rounds.
+    fitted_learners : list of estimators
+        The fitted learners.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n_rounds, n_samples = len(learners), y.shape[0]
+    learner_predictions = np.empty((n_rounds, n_samples))
+    ensemble_predictions = np.empty((n_rounds, n_samples))
+    residuals = np.empty((n_rounds, n_samples))
+    eval_predictions = (
+        None if X_eval is None else np.empty((n_rounds, len(X_eval)))
+    )
+
+    fitted_learners = []
+    target = y
+    for round_idx, learner in enumerate(learners):
+        learner = clone(learner).fit(X, target)
+        fitted_learners.append(learner)
+        learner_predictions[round_idx] = learner.predict(X)
+        ensemble_predictions[round_idx] = learner_predictions[round_idx]
+        if round_idx > 0:
+            ensemble_predictions[round_idx] += ensemble_predictions[
+                round_idx - 1
+            ]
+        residuals[round_idx] = y - ensemble_predictions[round_idx]
+        if X_eval is not None:
+            eval_predictions[round_idx] = learner.predict(X_eval)
+        target = residuals[round_idx]
+
+    trace = BoostingTrace(
+        learner_predictions=learner_predictions,
+        ensemble_predictions=ensemble_predictions,
+        residuals=residuals,
+        sample_weights=np.ones((n_rounds, n_samples)),
+        eval_predictions=eval_predictions,
+    )
+    return trace, fitted_learners
+
+
+def trace_adaboost(adaboost, X, y, X_eval=None):
+    """Traces the rounds of a fitted `AdaBoostClassifier`.
+
+    The sample weights are not stored by scikit-learn: they are replayed from
+    the errors of the learners and `adaboost.estimator_weights_`, with the
+    SAMME update of `AdaBoostClassifier.fit`.
+
+    Parameters
+    ----------
+    adaboost : AdaBoostClassifier
+        The fitted model.
+    X : array-like of shape (n_samples, n_features)
+        The data the model was fitted on.
+    y : array-like of shape (n_samples,)
+        The target the model was fitted on.
+    X_eval : array-like of shape (n_eval_samples, n_features), default=None
+        Data, e.g. the points of a decision boundary plot, on which to record
+        the predictions of the learners.
+
+    Returns
+    -------
+    trace : BoostingTrace
+        The trace of the rounds. `residuals` is a boolean array.
+    """
+    # The learners are fitted by the ensemble on arrays, without the feature
+    # names of X
+    X_array, y = np.asarray(X), np.asarray(y)
+    n_rounds, n_samples = len(adaboost.estimators_), y.shape[0]
+    learner_predictions = np.empty((n_rounds, n_samples), dtype=y.dtype)
+    ensemble_predictions = np.empty((n_rounds, n_samples), dtype=y.dtype)
+    residuals = np.empty((n_rounds, n_samples), dtype=bool)
+    sample_weights = np.empty((n_rounds, n_samples))
+    eval_predictions = (
+        None
+        if X_eval is None
+        else np.empty((n_rounds, len(X_eval)), dtype=adaboost.classes_.dtype)
+    )
+
+    epsilon = np.finfo(np.float64).eps
+    sample_weight = np.full(n_samples, 1 / n_samples)
+    # `staged_predict` passes X to `staged_decision_function` without its
+    # feature names, which warns for dataframes
+    staged_decisions = adaboost.staged_decision_function(X)
+    for round_idx, learner in enumerate(adaboost.estimators_):
+        sample_weights[round_idx] = np.clip(sample_weight, epsilon, None)
+        learner_predictions[round_idx] = learner.predict(X_array)
+        decision = next(staged_decisions)
+        if decision.ndim == 1:
+            ensemble_predictions[round_idx] = adaboost.classes_[
+                (decision > 0).astype(int)
+            ]
+        else:
+            ensemble_predictions[round_idx] = adaboost.classes_[
+                decision.argmax(axis=1)
+            ]
+        residuals[round_idx] = learner_predictions[round_idx] != y
+        if X_eval is not None:
+            eval_predictions[round_idx] = learner.predict(np.asarray(X_eval))
+
+        sample_weight = sample_weights[round_idx] * np.exp(
+            adaboost.estimator_weights_[round_idx] * residuals[round_idx]
+        )
+        sample_weight /= sample_weight.sum()
+
+    return BoostingTrace(
+        learner_predictions=learner_predictions,
+        ensemble_predictions=ensemble_predictions,
+        residuals=residuals,
+        sample_weights=sample_weights,
+        eval_predictions=eval_predictions,
+    )
@@ -45,8 +45,9 @@ data, target = make_classification(
 
 # %%
 from sklearn.ensemble import RandomForestClassifier
+from compute_config import N_JOBS
 
-model_without_selection = RandomForestClassifier(n_jobs=2)
+model_without_selection = RandomForestClassifier(n_jobs=N_JOBS)
 
 # %% [markdown]
 # Then, let's create a pipeline where the first stage will make the feature
@@ -60,7 +61,7 @@ from sklearn.pipeline import make_pipeline
 
 model_with_selection = make_pipeline(
     SelectKBest(score_func=f_classif, k=2),
-    RandomForestClassifier(n_jobs=2),
+    RandomForestClassifier(n_jobs=N_JOBS),
 )
 
 # %% [markdown]
@@ -43,10 +43,11 @@ data, target = rng.randn(100, 100000), rng.randint(0, 2, size=100)
 # solution
 from sklearn.model_selection import cross_val_score
 from sklearn.linear_model import LogisticRegression
+from compute_config import N_JOBS
 
 # solution
 model = LogisticRegression()
-test_score = cross_val_score(model, data, target, n_jobs=2)
+test_score = cross_val_score(model, data, target, n_jobs=N_JOBS)
 print(f"The mean accuracy is: {test_score.mean():.3f}")
 
 # %% [markdown] tags=["solution"]
@@ -134,10 +134,16 @@ axs[2].set(
 # plot the decision boundary of the model.
 #
 # Let's first define a function to help us fit a given model and plot its
-# decision boundary on the previous datasets at a glance:
+# decision boundary on the previous datasets at a glance.
+#
+# `draw_decision_boundary` draws the same figures as
+# `sklearn.inspection.DecisionBoundaryDisplay.from_estimator`. Some of the
+# models below are slow to predict, so it only predicts on every point of the
+# grid near the decision boundary, and interpolates elsewhere. The predictions
+# are reused to draw the 0.5 probability contour line on top of the colors.
 
 # %%
-from sklearn.inspection import DecisionBoundaryDisplay
+from plotting_tools import draw_decision_boundary
 
 
 def plot_decision_boundary(model, title=None):
@@ -158,7 +164,7 @@ def plot_decision_boundary(model, title=None):
         datasets,
     ):
         model.fit(data, target)
-        DecisionBoundaryDisplay.from_estimator(
+        draw_decision_boundary(
             model,
             data,
             response_method="predict_proba",
@@ -172,7 +178,7 @@ def plot_decision_boundary(model, title=None):
             vmax=1,
             ax=ax,
         )
-        DecisionBoundaryDisplay.from_estimator(
+        draw_decision_boundary(
             model,
             data,
             response_method="predict_proba",
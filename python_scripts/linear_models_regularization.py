@@ -426,6 +426,7 @@ ridge = make_pipeline(
 
 # %%
 from sklearn.model_selection import ShuffleSplit
+from compute_config import N_JOBS
 
 cv = ShuffleSplit(n_splits=50, random_state=0)
 cv_results = cross_validate(
@@ -436,7 +437,7 @@ cv_results = cross_validate(
     scoring="neg_mean_squared_error",
     return_train_score=True,
     return_estimator=True,
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 # %%
@@ -65,6 +65,7 @@ linear_regression = LinearRegression()
 # %%
 # solution
 from sklearn.model_selection import cross_validate
+from compute_config import N_JOBS
 
 cv_results = cross_validate(
     linear_regression,
@@ -72,7 +73,7 @@ cv_results = cross_validate(
     target,
     cv=10,
     scoring="neg_mean_absolute_error",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 # %% [markdown]
@@ -155,7 +156,7 @@ cv_results = cross_validate(
     target,
     cv=10,
     scoring="neg_mean_absolute_error",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 print(
     "Mean absolute error on testing set with interactions: "
@@ -204,7 +205,7 @@ disp = ValidationCurveDisplay.from_estimator(
     scoring="neg_mean_absolute_error",
     negate_score=True,
     std_display_style="errorbar",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 
 _ = disp.ax_.set(
@@ -232,7 +233,7 @@ cv_results = cross_validate(
     target,
     cv=10,
     scoring="neg_mean_absolute_error",
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 print(
     "Mean absolute error on testing set with nystroem: "
@@ -98,6 +98,7 @@ data = adult_census.drop(columns=["class", "education-num"])
 from sklearn.compose import make_column_selector as selector
 from sklearn.compose import make_column_transformer
 from sklearn.preprocessing import OneHotEncoder
+from compute_config import N_JOBS
 
 categorical_columns = selector(dtype_include=object)(data)
 numerical_columns = selector(dtype_exclude=object)(data)
@@ -111,7 +112,7 @@ preprocessor = make_column_transformer(
 )
 model = make_pipeline(preprocessor, LogisticRegression(max_iter=5_000))
 cv_results_complex_lr = cross_validate(
-    model, data, target, cv=10, return_estimator=True, n_jobs=2
+    model, data, target, cv=10, return_estimator=True, n_jobs=N_JOBS
 )
 test_score_complex_lr = cv_results_complex_lr["test_score"]
 test_score_complex_lr
@@ -234,7 +235,7 @@ cv_results_interactions = cross_validate(
     data,
     target,
     cv=10,
-    n_jobs=2,
+    n_jobs=N_JOBS,
 )
 test_score_interactions = cv_results_interactions["test_score"]
 test_score_interactions
@@ -0,0 +1,5 @@
+"""Helpers shared by the linear models lessons."""
+
+from .loss_surface import least_squares_fit, mean_squared_error_grid
+
+__all__ = ["least_squares_fit", "mean_squared_error_grid"]
@@ -189,6 +189,62 @@ ax = sns.scatterplot(
 ax.plot(flipper_length_range, predicted_body_mass)
 _ = ax.set_title(label.format(weight_flipper_length, intercept_body_mass))
 
+# %% [markdown]
+# ## The error of each pair of parameters
+#
+# The lines above were drawn with parameters chosen by hand. To compare them,
+# we can compute the mean squared error of the predictions of each line on the
+# penguins. Computing it for many pairs of parameters, on a grid of weights and
+# intercepts, draws the error as a function of the two parameters.
+# `mean_squared_error_grid` computes the predictions of all the pairs for all
+# the penguins at once with NumPy broadcasting, without a Python loop over the
+# pairs.
+
+# %%
+from linear_models_tools import least_squares_fit, mean_squared_error_grid
+
+weights = np.linspace(-50, 100, num=301)
+intercepts = np.linspace(-15000, 15000, num=301)
+errors = mean_squared_error_grid(data, target, weights, intercepts)
+
+# %% [markdown]
+# The parameters with the lowest error have a closed-form solution, the one of
+# ordinary least squares. We show it with the parameters of the lines drawn
+# above.
+
+# %%
+import matplotlib.pyplot as plt
+
+best_weight, best_intercept = least_squares_fit(data, target)
+
+levels = np.logspace(np.log10(errors.min()), np.log10(errors.max()), num=20)
+_, ax = plt.subplots()
+contour = ax.contourf(
+    weights, intercepts, errors, levels=levels, cmap="viridis"
+)
+plt.colorbar(contour, label="Mean squared error (g²)")
+hand_picked = [(45, -5000), (-40, 13000), (25, 0)]
+ax.scatter(*zip(*hand_picked), color="white", marker="x", label="Lines above")
+ax.scatter(
+    best_weight,
+    best_intercept,
+    color="tab:red",
+    marker="*",
+    s=150,
+    label="Least squares",
+)
+ax.set(
+    xlabel="weight_flipper_length (g / mm)", ylabel="intercept_body_mass (g)"
+)
+ax.legend()
+_ = ax.set_title(label.format(best_weight, best_intercept))
+
+# %% [markdown]
+# The error is low along a narrow valley: since the flipper lengths are around
+# 200 mm, increasing the weight by 1 g/mm and decreasing the intercept by about
+# 200 g barely changes the predictions. Learning a linear model amounts to
+# finding the bottom of this valley.
+
 # %% [markdown]
 #  In this notebook, we have seen the parametrization of a linear regression
 #  model and more precisely meaning of the terms weights and intercepts.
@@ -0,0 +1,6 @@
+"""Helpers shared by the model selection lessons."""
+
+from .incremental import incremental_validation_curve
+from .nested import repeated_nested_cross_validation
+
+__all__ = ["incremental_validation_curve", "repeated_nested_cross_validation"]
@@ -97,10 +97,18 @@ preprocessor = make_column_transformer(
 # %% [markdown]
 # Finally, we use a tree-based classifier (i.e. histogram gradient-boosting) to
 # predict whether or not a person earns more than 50 k$ a year.
+#
+# When tuning the classifier, the preprocessor is fitted on the same data for
+# every combination of parameters. We therefore pass a `joblib.Memory` to the
+# `memory` parameter of `Pipeline`: the fitted preprocessor and the
+# transformed data are stored on disk and reused instead of being computed
+# again. The `get_memory` helper of this course returns a memory shared by all
+# the notebooks, whose size is bounded.
 
 # %%
 from sklearn.ensemble import HistGradientBoostingClassifier
 from sklearn.pipeline import Pipeline
+from pipeline_cache import get_memory
 
 model = Pipeline(
     [
@@ -109,7 +117,8 @@ model = Pipeline(
             "classifier",
             HistGradientBoostingClassifier(random_state=42, max_leaf_nodes=4),
         ),
-    ]
+    ],
+    memory=get_memory(),
 )
 model
 
@@ -138,14 +147,24 @@ model
 
 # %%time
 from sklearn.model_selection import GridSearchCV
+from compute_config import N_JOBS
 
 param_grid = {
     "classifier__learning_rate": (0.01, 0.1, 1, 10),  # 4 possible values
     "classifier__max_leaf_nodes": (3, 10, 30),  # 3 possible values
 }  # 12 unique combinations
-model_grid_search = GridSearchCV(model, param_grid=param_grid, n_jobs=2, cv=2)
+model_grid_search = GridSearchCV(
+    model, param_grid=param_grid, n_jobs=N_JOBS, cv=2
+)
 model_grid_search.fit(data_train, target_train)
 
+# %% [markdown]
+# With an empty cache, the preprocessor is only fitted once per
+# cross-validation split, plus once on the whole training set to refit the
+# best model: the fits of the other combinations of parameters are read from
+# the cache. When the cache already contains them, e.g. when executing the
+# notebook again, none of them is fitted.
+
 # %% [markdown]
 # You can access the best combination of hyperparameters found by the grid
 # search using the `best_params_` attribute.
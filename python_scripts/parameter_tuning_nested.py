@@ -60,7 +60,9 @@ preprocessor = make_column_transformer(
 # %%
 from sklearn.ensemble import HistGradientBoostingClassifier
 from sklearn.pipeline import Pipeline
+from pipeline_cache import get_memory
 
+# The fitted preprocessor is cached and reused by the parameter searches below
 model = Pipeline(
     [
         ("preprocessor", preprocessor),
@@ -68,7 +70,8 @@ model = Pipeline(
             "classifier",
             HistGradientBoostingClassifier(random_state=42, max_leaf_nodes=4),
         ),
-    ]
+    ],
+    memory=get_memory(),
 )
 model
 
@@ -118,12 +121,15 @@ print(
 
 # %%
 from sklearn.model_selection import GridSearchCV
+from compute_config import ESTIMATOR_N_JOBS, N_JOBS
 
 param_grid = {
     "classifier__learning_rate": (0.05, 0.5),
     "classifier__max_leaf_nodes": (10, 30),
 }
-model_grid_search = GridSearchCV(model, param_grid=param_grid, n_jobs=2, cv=2)
+model_grid_search = GridSearchCV(
+    model, param_grid=param_grid, n_jobs=ESTIMATOR_N_JOBS, cv=2
+)
 model_grid_search.fit(data, target)
 
 # %% [markdown]
@@ -229,7 +235,7 @@ print(f"Accuracy on test set: {accuracy:.3f}")
 
 # %%
 cv_results = cross_validate(
-    model_grid_search, data, target, cv=5, n_jobs=2, return_estimator=True
+    model_grid_search, data, target, cv=5, n_jobs=N_JOBS, return_estimator=True
 )
 
 # %%
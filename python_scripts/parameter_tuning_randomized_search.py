@@ -240,11 +240,15 @@ cv_results
 # the results obtained from a similar search with 500 iterations.
 
 # %%
+# The results were obtained with the search below. The script
+# `build_tools/generate-randomized-search-results.py` runs the same search in
+# parallel, with a fixed random state, to generate them again.
+#
 # model_random_search = RandomizedSearchCV(
 #     model, param_distributions=param_distributions, n_iter=500,
 #     n_jobs=2, cv=5)
 # model_random_search.fit(data_train, target_train)
-# cv_results =  pd.DataFrame(model_random_search.cv_results_)
+# cv_results = pd.DataFrame(model_random_search.cv_results_)
 # cv_results.to_csv("../figures/randomized_search_results.csv")
 
 # %%
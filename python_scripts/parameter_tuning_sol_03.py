@@ -78,6 +78,7 @@ model = make_pipeline(scaler, KNeighborsRegressor())
 # solution
 import numpy as np
 from sklearn.model_selection import RandomizedSearchCV
+from compute_config import N_JOBS
 
 param_distributions = {
     "kneighborsregressor__n_neighbors": np.logspace(0, 3, num=10).astype(
@@ -92,7 +93,7 @@ model_random_search = RandomizedSearchCV(
     param_distributions=param_distributions,
     scoring="neg_mean_absolute_error",
     n_iter=20,
-    n_jobs=2,
+    n_jobs=N_JOBS,
     verbose=1,
     random_state=1,
 )
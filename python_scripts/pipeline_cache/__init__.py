@@ -0,0 +1,5 @@
+"""Cache of the preprocessing steps of the pipelines of the course."""
+
+from .memory import cache_info, clear_cache, get_memory
+
+__all__ = ["cache_info", "clear_cache", "get_memory"]
@@ -0,0 +1,228 @@
+"""Decision boundaries of models fitted on two features.
+
+`DecisionBoundaryDisplay.from_estimator` predicts on every point of a
+`grid_resolution x grid_resolution` mesh, each time it is called. With models
+made of an expensive feature engineering step, e.g. splines or a kernel
+approximation, most of the time of a plot is spent there, although the
+response is constant, or smooth, almost everywhere.
+
+`decision_boundary_response` computes the same response on the same mesh:
+
+- it first predicts on a coarse mesh, every `coarse_step` points of the full
+  mesh;
+- a cell of the coarse mesh is refined, i.e. all its points are predicted,
+  when the predicted class changes between its corners, or when its response
+  varies by more than `tol` times the range of the response. The response of
+  the other cells is interpolated from their corners.
+
+A region of another class smaller than a coarse cell, with no corner in it,
+can be missed: `coarse_step=1` predicts on the full mesh.
+
+The responses are cached per fitted model, data and mesh, so that drawing
+again the boundary of a model, e.g. as filled colors and then as a contour,
+does not predict again.
+"""
+
+from collections import OrderedDict
+
+import joblib
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+CACHE_SIZE = 32
+
+_responses = OrderedDict()
+
+
+def _mesh(X, grid_resolution, eps):
+    """Returns the mesh of `DecisionBoundaryDisplay.from_estimator`."""
+    X = np.asarray(X)
+    x0_min, x0_max = X[:, 0].min() - eps, X[:, 0].max() + eps
+    x1_min, x1_max = X[:, 1].min() - eps, X[:, 1].max() + eps
+    return np.meshgrid(
+        np.linspace(x0_min, x0_max, grid_resolution),
+        np.linspace(x1_min, x1_max, grid_resolution),
+    )
+
+
+def _predict(estimator, X, points, response_method):
+    if hasattr(X, "columns"):
+        points = X.__class__(points, columns=X.columns)
+    response = getattr(estimator, response_method)(points)
+    if response_method == "predict":
+        # Class indices, as in `DecisionBoundaryDisplay`
+        return np.searchsorted(estimator.classes_, response).astype(float)
+    if response.ndim == 2:
+        if response.shape[1] != 2:
+            raise ValueError(
+                f"{response_method} is only supported for binary classifiers"
+            )
+        return response[:, 1]
+    return response
+
+
+def _refined_cells(coarse_response, response_method, tol):
+    """Returns whether each cell of the coarse mesh must be refined."""
+    corners = np.stack(
+        [
+            coarse_response[:-1, :-1],
+            coarse_response[1:, :-1],
+            coarse_response[:-1, 1:],
+            coarse_response[1:, 1:],
+        ]
+    )
+    if response_method == "predict":
+        return (corners != corners[0]).any(axis=0)
+
+    threshold = 0.5 if response_method == "predict_proba" else 0.0
+    predicted_class = corners > threshold
+    class_changes = (predicted_class != predicted_class[0]).any(axis=0)
+    response_range = np.ptp(coarse_response)
+    varies = np.ptp(corners, axis=0) > tol * response_range
+    return class_changes | varies
+
+
+def decision_boundary_response(
+    estimator,
+    X,
+    response_method="predict",
+    grid_resolution=100,
+    eps=1.0,
+    coarse_step=8,
+    tol=0.02,
+):
+    """Computes the response of a model on the mesh of a decision boundary.
+
+    Parameters
+    ----------
+    estimator : estimator
+        A fitted classifier on two features.
+    X : array-like of shape (n_samples, 2)
+        The data giving the limits of the mesh.
+    response_method : {"predict", "predict_proba", "decision_function"}, \
+            default="predict"
+        The response to plot: the index of the predicted class, or the
+        probability or decision function of the positive class of a binary
+        classifier.
+    grid_resolution : int, default=100
+        Number of points of the mesh along each feature.
+    eps : float, default=1.0
+        Margin added to the limits of the data.
+    coarse_step : int, default=8
+        Number of points of the mesh between two points of the coarse mesh.
+    tol : float, default=0.02
+        Largest variation of the response in a cell of the coarse mesh,
+        relative to the range of the response, for the cell not to be
+        refined. Unused for "predict".
+
+    Returns
+    -------
+    xx0, xx1 : ndarray of shape (grid_resolution, grid_resolution)
+        The mesh.
+    response : ndarray of shape (grid_resolution, grid_resolution)
+        The response of the model on the mesh.
+    """
+    key = (
+        joblib.hash(estimator),
+        joblib.hash(X),
+        response_method,
+        grid_resolution,
+        eps,
+        coarse_step,
+        tol,
+    )
+    if key in _responses:
+        _responses.move_to_end(key)
+        return _responses[key]
+
+    xx0, xx1 = _mesh(X, grid_resolution, eps)
+    points = np.c_[xx0.ravel(), xx1.ravel()]
+
+    # The last point is always in the coarse mesh, so that the coarse cells
+    # cover the whole mesh
+    coarse = np.unique(
+        np.r_[np.arange(0, grid_resolution, coarse_step), grid_resolution - 1]
+    )
+    coarse_idx = np.ravel_multi_index(
+        np.meshgrid(coarse, coarse, indexing="ij"), xx0.shape
+    ).ravel()
+    coarse_response = _predict(
+        estimator, X, points[coarse_idx], response_method
+    ).reshape(len(coarse), len(coarse))
+
+    fine = np.arange(grid_resolution)
+    interpolator = RegularGridInterpolator((coarse, coarse), coarse_response)
+    response = interpolator(
+        np.stack(np.meshgrid(fine, fine, indexing="ij"), axis=-1)
+    )
+
+    refined = np.zeros(xx0.shape, dtype=bool)
+    refined_cells = _refined_cells(coarse_response, response_method, tol)
+    for row, col in zip(*np.nonzero(refined_cells)):
+        refined[
+            coarse[row] : coarse[row + 1] + 1,
+            coarse[col] : coarse[col + 1] + 1,
+        ] = True
+    if refined.any():
+        response[refined] = _predict(
+            estimator, X, points[refined.ravel()], response_method
+        )
+
+    _responses[key] = xx0, xx1, response
+    if len(_responses) > CACHE_SIZE:
+        _responses.popitem(last=False)
+    return xx0, xx1, response
+
+
+def draw_decision_boundary(
+    estimator,
+    X,
+    response_method="predict",
+    plot_method="contourf",
+    ax=None,
+    grid_resolution=100,
+    eps=1.0,
+    coarse_step=8,
+    tol=0.02,
+    **kwargs,
+):
+    """Draws the decision boundary of a model fitted on two features.
+
+    It draws what `DecisionBoundaryDisplay.from_estimator` draws, from the
+    response computed by `decision_boundary_response`.
+
+    Parameters
+    ----------
+    estimator, X, response_method, grid_resolution, eps, coarse_step, tol
+        See `decision_boundary_response`.
+    plot_method : {"contourf", "contour", "pcolormesh"}, default="contourf"
+        The matplotlib method drawing the response.
+    ax : matplotlib Axes, default=None
+        The axes to draw on, the current axes if None.
+    **kwargs : dict
+        Passed to the matplotlib method.
+
+    Returns
+    -------
+    ax : matplotlib Axes
+        The axes.
+    """
+    import matplotlib.pyplot as plt
+
+    if ax is None:
+        ax = plt.gca()
+    xx0, xx1, response = decision_boundary_response(
+        estimator,
+        X,
+        response_method=response_method,
+        grid_resolution=grid_resolution,
+        eps=eps,
+        coarse_step=coarse_step,
+        tol=tol,
+    )
+    if plot_method == "pcolormesh":
+        kwargs.setdefault("shading", "auto")
+    getattr(ax, plot_method)(xx0, xx1, response, **kwargs)
+    if hasattr(X, "columns"):
+        ax.set(xlabel=X.columns[0], ylabel=X.columns[1])
+    return ax
@@ -37,9 +37,9 @@
 # We start by loading this subset of the dataset.
 
 # %%
-import pandas as pd
+from dataset_tools import load_dataset
 
-penguins = pd.read_csv("../datasets/penguins_classification.csv")
+penguins = load_dataset("penguins_classification")
 
 culmen_columns = ["Culmen Length (mm)", "Culmen Depth (mm)"]
 target_column = "Species"
@@ -81,7 +81,7 @@ pairplot_figure.fig.set_size_inches(9, 6.5)
 # and the body mass of penguins.
 
 # %%
-penguins = pd.read_csv("../datasets/penguins_regression.csv")
+penguins = load_dataset("penguins_regression")
 
 feature_name = "Flipper Length (mm)"
 target_column = "Body Mass (g)"